@@ -2,7 +2,7 @@
 
 import asyncio
 
-from deltatrader import Config, Strategy, TradingEngine
+from deltatrader import Config, Strategy, TradingEngine, configure_loop
 from deltatrader.models.orderbook import OrderBook
 from deltatrader.models.trade import Trade
 from deltatrader.utils.logger import logger
@@ -337,5 +337,6 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Run the async main function
+    # Use uvloop when installed, then run the async main function
+    configure_loop()
     asyncio.run(main())
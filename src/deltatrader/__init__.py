@@ -5,7 +5,8 @@ Delta Exchange India futures trading framework.
 from .core.engine import TradingEngine
 from .strategies.base import Strategy
 from .utils.config import Config
+from .utils.event_loop import configure_loop
 
 __version__ = "0.1.0"
 
-__all__ = ["TradingEngine", "Strategy", "Config"]
+__all__ = ["TradingEngine", "Strategy", "Config", "configure_loop"]
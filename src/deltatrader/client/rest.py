@@ -5,11 +5,40 @@ from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..client.auth import get_auth_headers, sign_request
 from ..models.product import Product
 from ..utils.config import Config
 from ..utils.logger import logger
 
+# Decoder for response bodies; orjson.JSONDecodeError subclasses json's
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+class RestApiError(aiohttp.ClientError):
+    """Error response from the REST API."""
+
+    def __init__(self, status: int, message: str, retry_after: float | None = None):
+        super().__init__(f"API error {status}: {message}")
+        self.status = status
+        self.retry_after = retry_after  # seconds, from the Retry-After header
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given in seconds."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
 
 class RestClient:
     """Async REST client for Delta Exchange API."""
@@ -30,10 +59,15 @@ class RestClient:
         await self.close()
 
     async def connect(self) -> None:
-        """Create aiohttp session."""
+        """Create aiohttp session with a pooled keep-alive connector."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=Config.REST_TIMEOUT)
-            self.session = aiohttp.ClientSession(timeout=timeout)
+            connector = aiohttp.TCPConnector(
+                limit=Config.REST_POOL_SIZE,
+                ttl_dns_cache=Config.REST_DNS_CACHE_TTL,
+                keepalive_timeout=Config.REST_KEEPALIVE_TIMEOUT,
+            )
+            self.session = aiohttp.ClientSession(timeout=timeout, connector=connector)
             logger.info(f"REST client connected to {self.base_url}")
 
     async def close(self) -> None:
@@ -64,6 +98,7 @@ class RestClient:
             Response JSON data
 
         Raises:
+            RestApiError: On an error response from the API
             aiohttp.ClientError: On request failure
         """
         if self.session is None:
@@ -115,7 +150,7 @@ class RestClient:
 
                 # Handle response - try JSON first, fall back to text
                 try:
-                    response_data = await response.json()
+                    response_data = await response.json(loads=_json_loads)
                 except (aiohttp.ContentTypeError, json.JSONDecodeError):
                     # Response is not JSON (might be HTML for 404, etc.)
                     response_text = await response.text()
@@ -123,8 +158,10 @@ class RestClient:
                         logger.error(
                             f"REST API error: {response.status} - Non-JSON response: {response_text}"
                         )
-                        raise aiohttp.ClientError(
-                            f"API error {response.status}: {response_text[:100]}"
+                        raise RestApiError(
+                            response.status,
+                            response_text[:100],
+                            _parse_retry_after(response.headers.get("Retry-After")),
                         )
                     # For successful non-JSON responses, return empty dict
                     return {}
@@ -136,8 +173,10 @@ class RestClient:
                     logger.error(
                         f"REST API error: {response.status} - {error_msg} - {response_data}"
                     )
-                    raise aiohttp.ClientError(
-                        f"API error {response.status}: {error_msg}"
+                    raise RestApiError(
+                        response.status,
+                        error_msg,
+                        _parse_retry_after(response.headers.get("Retry-After")),
                     )
 
                 return response_data
@@ -280,6 +319,26 @@ class RestClient:
         )
         return response.get("result", {})
 
+    async def place_batch_orders(
+        self, product_id: int, orders: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Place multiple orders for one product in a single request.
+
+        Args:
+            product_id: Product ID shared by all orders
+            orders: Order payloads (size, side, order_type, limit_price,
+                client_order_id)
+
+        Returns:
+            List of order response data
+        """
+        data = {"product_id": product_id, "orders": orders}
+        response = await self._request("POST", "/v2/orders/batch", data=data)
+        logger.info(f"Batch placed: {len(orders)} orders for product_id={product_id}")
+        placed: list[dict[str, Any]] = response.get("result", [])
+        return placed
+
     async def cancel_order(
         self, client_order_id: str, product_id: int
     ) -> dict[str, Any]:
@@ -298,6 +357,30 @@ class RestClient:
         logger.info(f"Order cancelled: {client_order_id}")
         return response.get("result", {})
 
+    async def cancel_batch_orders(
+        self, product_id: int, client_order_ids: list[str]
+    ) -> list[dict[str, Any]]:
+        """
+        Cancel multiple orders for one product in a single request.
+
+        Args:
+            product_id: Product ID shared by all orders
+            client_order_ids: Client order IDs to cancel
+
+        Returns:
+            List of cancellation response data
+        """
+        data = {
+            "product_id": product_id,
+            "orders": [{"client_order_id": cid} for cid in client_order_ids],
+        }
+        response = await self._request("DELETE", "/v2/orders/batch", data=data)
+        logger.info(
+            f"Batch cancelled: {len(client_order_ids)} orders for product_id={product_id}"
+        )
+        cancelled: list[dict[str, Any]] = response.get("result", [])
+        return cancelled
+
     async def cancel_all_orders(self, product_id: int | None = None) -> dict[str, Any]:
         """
         Cancel all orders.
@@ -2,15 +2,31 @@
 
 import asyncio
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import aiohttp
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from ..utils.config import Config
 from ..utils.logger import logger
 from .auth import create_websocket_auth_message, sign_websocket_auth
 
+# Heartbeat reply is constant, so serialize it once instead of per heartbeat
+_HEARTBEAT_REPLY = json.dumps({"type": "heartbeat"})
+
+# l2_updates actions routed to orderbook handlers regardless of message type
+_L2_ACTIONS = frozenset({"snapshot", "update", "error"})
+
+# Decoder for incoming frames; orjson.JSONDecodeError subclasses json's
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 
 class WebSocketClient:
     """Async WebSocket client for Delta Exchange."""
@@ -26,34 +42,41 @@ class WebSocketClient:
 
         # Channel subscriptions
         self._subscriptions: set[str] = set()
-        self._channel_handlers: dict[str, list[Callable]] = {}
+        # Serialized resubscribe message keyed by the subscription snapshot
+        # it was built from, so it is rebuilt only when subscriptions change
+        self._cached_sub_payload: tuple[frozenset[str], str] | None = None
+        # Handler collections are tuples: iterated on every message, rebuilt
+        # only by add_handler/remove_handler
+        self._channel_handlers: dict[str, tuple[Callable, ...]] = {}
 
         # Message handlers by type
-        self._message_handlers: dict[str, list[Callable]] = {
-            "snapshot": [],
-            "update": [],
-            "error": [],  # For l2_updates error messages
-            "l2_orderbook": [],
-            "all_trades": [],
-            "all_trades_snapshot": [],
-            "ticker": [],
-            "subscriptions": [],
-            "heartbeat": [],
+        self._message_handlers: dict[str, tuple[Callable, ...]] = {
+            "snapshot": (),
+            "update": (),
+            "error": (),  # For l2_updates error messages
+            "l2_orderbook": (),
+            "all_trades": (),
+            "all_trades_snapshot": (),
+            "ticker": (),
+            "subscriptions": (),
+            "heartbeat": (),
             # Order update message types
-            "order_created": [],
-            "order_open": [],
-            "order_cancelled": [],
-            "order_closed": [],
-            "order_rejected": [],
-            "orders": [],  # Generic order updates
-            "fill": [],
-            "fills": [],  # Generic fills
-            "position_update": [],
-            "positions": [],  # Generic position updates
+            "order_created": (),
+            "order_open": (),
+            "order_cancelled": (),
+            "order_closed": (),
+            "order_rejected": (),
+            "orders": (),  # Generic order updates
+            "fill": (),
+            "fills": (),  # Generic fills
+            "position_update": (),
+            "positions": (),  # Generic position updates
+            "reconnect": (),  # Connection re-established, updates may be missed
         }
 
         # Heartbeat tracking
-        self._last_heartbeat = 0
+        self._last_heartbeat = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._heartbeat_task: asyncio.Task | None = None
         self._watchdog_task: asyncio.Task | None = None
 
@@ -88,6 +111,7 @@ class WebSocketClient:
             self.ws = await self.session.ws_connect(self.url)
 
             self._running = True
+            self._loop = asyncio.get_running_loop()
             self._reconnect_attempts = 0
             self._connect_event.set()
 
@@ -107,6 +131,11 @@ class WebSocketClient:
             # Resubscribe to channels
             await self._resubscribe_all()
 
+            # Updates sent while disconnected are lost; let listeners resync
+            if reconnect:
+                for handler in self._message_handlers.get("reconnect", ()):
+                    asyncio.create_task(handler({"type": "reconnect"}))
+
         except Exception as e:
             logger.error(f"WebSocket connection failed: {e}", exc_info=True)
             self._running = False
@@ -119,25 +148,19 @@ class WebSocketClient:
         self._running = False
         self._connect_event.clear()
 
-        # Cancel tasks
-        if self._receive_task:
-            self._receive_task.cancel()
-            try:
-                await self._receive_task
-            except asyncio.CancelledError:
-                pass
-        if self._heartbeat_task:
-            self._heartbeat_task.cancel()
-            try:
-                await self._heartbeat_task
-            except asyncio.CancelledError:
-                pass
-        if self._watchdog_task:
-            self._watchdog_task.cancel()
-            try:
-                await self._watchdog_task
-            except asyncio.CancelledError:
-                pass
+        # Cancel tasks and drain them together
+        tasks = [
+            task
+            for task in (
+                self._receive_task,
+                self._heartbeat_task,
+                self._watchdog_task,
+            )
+            if task
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         # Close WebSocket
         if self.ws and not self.ws.closed:
@@ -174,6 +197,13 @@ class WebSocketClient:
         else:
             logger.warning("Cannot send message: WebSocket not connected")
 
+    async def _send_raw(self, payload: str) -> None:
+        """Send an already-serialized message to WebSocket."""
+        if self.ws and not self.ws.closed:
+            await self.ws.send_str(payload)
+        else:
+            logger.warning("Cannot send message: WebSocket not connected")
+
     async def _receive_loop(self) -> None:
         """Main receive loop for WebSocket messages."""
         try:
@@ -182,7 +212,7 @@ class WebSocketClient:
             async for msg in self.ws:
                 if msg.type == aiohttp.WSMsgType.TEXT:
                     try:
-                        data = json.loads(msg.data)
+                        data = _json_loads(msg.data)
                         await self._handle_message(data)
                     except json.JSONDecodeError as e:
                         logger.error(f"Failed to decode message: {e}")
@@ -216,154 +246,131 @@ class WebSocketClient:
     async def _handle_message(self, data: dict[str, Any]) -> None:
         """Handle incoming WebSocket message."""
         # logger.debug(f"RECV WS MSG -> {data}")
-        msg_type = data.get("type")
+        msg_type: str = data.get("type", "")
         # logger.debug(f"MSG TYPE: {msg_type}")
 
-        # Handle heartbeat
-        if msg_type == "heartbeat":
-            self._last_heartbeat = asyncio.get_event_loop().time()
-            await self._send_message({"type": "heartbeat"})
-            return
-
-        # Handle subscriptions confirmation
-        if msg_type == "subscriptions":
-            logger.debug(f"Subscriptions confirmed: {data.get('channels', [])}")
-            for handler in self._message_handlers.get("subscriptions", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle l2_orderbook (full snapshot from Delta Exchange)
-        if msg_type == "l2_orderbook":
-            symbol = data.get("symbol")
-            if symbol:
-                channel_key = f"l2_orderbook.{symbol}"
-                if channel_key in self._channel_handlers:
-                    for handler in self._channel_handlers[channel_key]:
-                        asyncio.create_task(handler(data))
-
-            # Also call generic handlers
-            for handler in self._message_handlers.get("l2_orderbook", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle l2_updates messages - check 'action' field for snapshot/update/error
-        action = data.get("action")
-        if action in ["snapshot", "update", "error"]:
-            symbol = data.get("symbol")
-            if symbol:
-                # Try l2_updates channel first, then fall back to l2_orderbook
-                channel_key = f"l2_updates.{symbol}"
-                if channel_key in self._channel_handlers:
-                    for handler in self._channel_handlers[channel_key]:
-                        asyncio.create_task(handler(data))
-                else:
-                    # Fallback for backward compatibility
+        # Market data messages are routed per symbol; look it up once
+        symbol = data.get("symbol")
+
+        match msg_type:
+            # Handle heartbeat
+            case "heartbeat":
+                loop = self._loop or asyncio.get_running_loop()
+                self._last_heartbeat = loop.time()
+                await self._send_raw(_HEARTBEAT_REPLY)
+
+            # Handle subscriptions confirmation
+            case "subscriptions":
+                logger.debug(f"Subscriptions confirmed: {data.get('channels', [])}")
+                for handler in self._message_handlers.get("subscriptions", ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle l2_orderbook (full snapshot from Delta Exchange)
+            case "l2_orderbook":
+                if symbol:
                     channel_key = f"l2_orderbook.{symbol}"
                     if channel_key in self._channel_handlers:
                         for handler in self._channel_handlers[channel_key]:
                             asyncio.create_task(handler(data))
 
-            # Also call generic handlers using action as message type
-            for handler in self._message_handlers.get(action, []):
-                asyncio.create_task(handler(data))
-            return
+                # Also call generic handlers
+                for handler in self._message_handlers.get("l2_orderbook", ()):
+                    asyncio.create_task(handler(data))
 
-        # Handle legacy snapshot/update messages with 'type' field (for backward compatibility)
-        if msg_type in ["snapshot", "update"]:
-            symbol = data.get("symbol")
-            if symbol:
-                # Try both channel types
-                for channel_prefix in ["l2_updates", "l2_orderbook"]:
-                    channel_key = f"{channel_prefix}.{symbol}"
+            # Handle l2_updates messages - check 'action' field for snapshot/update/error
+            case _ if (action := data.get("action")) in _L2_ACTIONS:
+                if symbol:
+                    # Try l2_updates channel first, then fall back to l2_orderbook
+                    channel_key = f"l2_updates.{symbol}"
+                    if channel_key in self._channel_handlers:
+                        for handler in self._channel_handlers[channel_key]:
+                            asyncio.create_task(handler(data))
+                    else:
+                        # Fallback for backward compatibility
+                        channel_key = f"l2_orderbook.{symbol}"
+                        if channel_key in self._channel_handlers:
+                            for handler in self._channel_handlers[channel_key]:
+                                asyncio.create_task(handler(data))
+
+                # Also call generic handlers using action as message type
+                for handler in self._message_handlers.get(action, ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle legacy snapshot/update messages with 'type' field (for backward compatibility)
+            case "snapshot" | "update":
+                if symbol:
+                    # Try both channel types
+                    for channel_prefix in ["l2_updates", "l2_orderbook"]:
+                        channel_key = f"{channel_prefix}.{symbol}"
+                        if channel_key in self._channel_handlers:
+                            for handler in self._channel_handlers[channel_key]:
+                                asyncio.create_task(handler(data))
+
+                # Also call generic handlers
+                for handler in self._message_handlers.get(msg_type, ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle all_trades_snapshot (initial snapshot of trades) and
+            # all_trades (live trade updates)
+            case "all_trades_snapshot" | "all_trades":
+                if symbol:
+                    channel_key = f"all_trades.{symbol}"
                     if channel_key in self._channel_handlers:
                         for handler in self._channel_handlers[channel_key]:
                             asyncio.create_task(handler(data))
 
-            # Also call generic handlers
-            for handler in self._message_handlers.get(msg_type, []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle all_trades_snapshot (initial snapshot of trades)
-        if msg_type == "all_trades_snapshot":
-            symbol = data.get("symbol")
-            if symbol:
-                channel_key = f"all_trades.{symbol}"
-                if channel_key in self._channel_handlers:
-                    for handler in self._channel_handlers[channel_key]:
-                        asyncio.create_task(handler(data))
-
-            for handler in self._message_handlers.get("all_trades_snapshot", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle all_trades (live trade updates)
-        if msg_type == "all_trades":
-            symbol = data.get("symbol")
-            if symbol:
-                channel_key = f"all_trades.{symbol}"
-                if channel_key in self._channel_handlers:
-                    for handler in self._channel_handlers[channel_key]:
-                        asyncio.create_task(handler(data))
-
-            for handler in self._message_handlers.get("all_trades", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle ticker
-        if msg_type == "v2/ticker":
-            symbol = data.get("symbol")
-            if symbol:
-                channel_key = f"v2/ticker.{symbol}"
-                if channel_key in self._channel_handlers:
-                    for handler in self._channel_handlers[channel_key]:
-                        asyncio.create_task(handler(data))
-
-            for handler in self._message_handlers.get("ticker", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle order updates
-        if msg_type in [
-            "order_created",
-            "order_open",
-            "order_cancelled",
-            "order_closed",
-            "order_rejected",
-        ]:
-            # Call order-specific handlers
-            for handler in self._message_handlers.get(msg_type, []):
-                asyncio.create_task(handler(data))
-
-            # Also call generic order handlers
-            for handler in self._message_handlers.get("orders", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle fill updates
-        if msg_type == "fill":
-            for handler in self._message_handlers.get("fill", []):
-                asyncio.create_task(handler(data))
-
-            # Also call generic fills handlers
-            for handler in self._message_handlers.get("fills", []):
-                asyncio.create_task(handler(data))
-            return
-
-        # Handle position updates
-        if msg_type == "position_update":
-            for handler in self._message_handlers.get("position_update", []):
-                asyncio.create_task(handler(data))
+                for handler in self._message_handlers.get(msg_type, ()):
+                    asyncio.create_task(handler(data))
 
-            # Also call generic position handlers
-            for handler in self._message_handlers.get("positions", []):
-                asyncio.create_task(handler(data))
-            return
+            # Handle ticker
+            case "v2/ticker":
+                if symbol:
+                    channel_key = f"v2/ticker.{symbol}"
+                    if channel_key in self._channel_handlers:
+                        for handler in self._channel_handlers[channel_key]:
+                            asyncio.create_task(handler(data))
 
-        # Generic message type handlers
-        if msg_type in self._message_handlers:
-            for handler in self._message_handlers[msg_type]:
-                asyncio.create_task(handler(data))
+                for handler in self._message_handlers.get("ticker", ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle order updates
+            case (
+                "order_created"
+                | "order_open"
+                | "order_cancelled"
+                | "order_closed"
+                | "order_rejected"
+            ):
+                # Call order-specific handlers
+                for handler in self._message_handlers.get(msg_type, ()):
+                    asyncio.create_task(handler(data))
+
+                # Also call generic order handlers
+                for handler in self._message_handlers.get("orders", ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle fill updates
+            case "fill":
+                for handler in self._message_handlers.get("fill", ()):
+                    asyncio.create_task(handler(data))
+
+                # Also call generic fills handlers
+                for handler in self._message_handlers.get("fills", ()):
+                    asyncio.create_task(handler(data))
+
+            # Handle position updates
+            case "position_update":
+                for handler in self._message_handlers.get("position_update", ()):
+                    asyncio.create_task(handler(data))
+
+                # Also call generic position handlers
+                for handler in self._message_handlers.get("positions", ()):
+                    asyncio.create_task(handler(data))
+
+            # Generic message type handlers
+            case _:
+                for handler in self._message_handlers.get(msg_type, ()):
+                    asyncio.create_task(handler(data))
 
     async def subscribe(self, channels: list[str]) -> None:
         """
@@ -382,24 +389,7 @@ class WebSocketClient:
 
         # Send subscription message if connected
         if self.ws and not self.ws.closed:
-            # Parse channels into proper format for Delta Exchange
-            # Convert ["l2_orderbook.BTCUSD", "all_trades.BTCUSD"] to
-            # [{"name": "l2_orderbook", "symbols": ["BTCUSD"]}, ...]
-            channel_map = {}
-            for channel_str in channels:
-                parts = channel_str.split(".", 1)
-                if len(parts) == 2:
-                    channel_name, symbol = parts
-                    if channel_name not in channel_map:
-                        channel_map[channel_name] = []
-                    channel_map[channel_name].append(symbol)
-
-            # Build subscription payload in Delta Exchange format
-            channel_list = [
-                {"name": name, "symbols": symbols}
-                for name, symbols in channel_map.items()
-            ]
-
+            channel_list = self._build_channel_list(channels)
             sub_message = {"type": "subscribe", "payload": {"channels": channel_list}}
             logger.debug(f"channel message: {sub_message}")
             await self._send_message(sub_message)
@@ -418,21 +408,7 @@ class WebSocketClient:
 
         # Send unsubscribe message if connected
         if self.ws and not self.ws.closed:
-            # Parse channels into proper format
-            channel_map = {}
-            for channel_str in channels:
-                parts = channel_str.split(".", 1)
-                if len(parts) == 2:
-                    channel_name, symbol = parts
-                    if channel_name not in channel_map:
-                        channel_map[channel_name] = []
-                    channel_map[channel_name].append(symbol)
-
-            channel_list = [
-                {"name": name, "symbols": symbols}
-                for name, symbols in channel_map.items()
-            ]
-
+            channel_list = self._build_channel_list(channels)
             unsub_message = {
                 "type": "unsubscribe",
                 "payload": {"channels": channel_list},
@@ -506,12 +482,42 @@ class WebSocketClient:
         await self._send_message(sub_message)
         logger.info("Subscribed to position updates")
 
+    @staticmethod
+    def _build_channel_list(channels: Iterable[str]) -> list[dict[str, Any]]:
+        """
+        Group channel.symbol strings into Delta Exchange's channel format.
+
+        Converts ["l2_orderbook.BTCUSD", "all_trades.BTCUSD"] to
+        [{"name": "l2_orderbook", "symbols": ["BTCUSD"]}, ...]
+        """
+        channel_map: dict[str, list[str]] = {}
+        for channel_str in channels:
+            parts = channel_str.split(".", 1)
+            if len(parts) == 2:
+                channel_name, symbol = parts
+                if channel_name not in channel_map:
+                    channel_map[channel_name] = []
+                channel_map[channel_name].append(symbol)
+
+        return [
+            {"name": name, "symbols": symbols} for name, symbols in channel_map.items()
+        ]
+
     async def _resubscribe_all(self) -> None:
         """Resubscribe to all channels after reconnection."""
-        if self._subscriptions:
-            channels = list(self._subscriptions)
-            logger.info(f"Resubscribing to {len(channels)} channels")
-            await self.subscribe(channels)
+        # Work from an immutable snapshot so concurrent subscribe/unsubscribe
+        # calls cannot mutate the set while it is being iterated
+        snapshot = frozenset(self._subscriptions)
+        if snapshot:
+            cached = self._cached_sub_payload
+            if cached is None or cached[0] != snapshot:
+                channel_list = self._build_channel_list(snapshot)
+                payload = json.dumps(
+                    {"type": "subscribe", "payload": {"channels": channel_list}}
+                )
+                cached = self._cached_sub_payload = (snapshot, payload)
+            logger.info(f"Resubscribing to {len(snapshot)} channels")
+            await self._send_raw(cached[1])
 
     def add_handler(self, channel_or_type: str, handler: Callable) -> None:
         """
@@ -523,14 +529,11 @@ class WebSocketClient:
         """
         # Check if it's a specific channel
         if "." in channel_or_type or channel_or_type.startswith("v2/"):
-            if channel_or_type not in self._channel_handlers:
-                self._channel_handlers[channel_or_type] = []
-            self._channel_handlers[channel_or_type].append(handler)
+            handlers = self._channel_handlers
         else:
             # It's a message type
-            if channel_or_type not in self._message_handlers:
-                self._message_handlers[channel_or_type] = []
-            self._message_handlers[channel_or_type].append(handler)
+            handlers = self._message_handlers
+        handlers[channel_or_type] = handlers.get(channel_or_type, ()) + (handler,)
 
     def remove_handler(self, channel_or_type: str, handler: Callable) -> None:
         """
@@ -541,11 +544,14 @@ class WebSocketClient:
             handler: Handler to remove
         """
         if "." in channel_or_type or channel_or_type.startswith("v2/"):
-            if channel_or_type in self._channel_handlers:
-                self._channel_handlers[channel_or_type].remove(handler)
+            handlers = self._channel_handlers
         else:
-            if channel_or_type in self._message_handlers:
-                self._message_handlers[channel_or_type].remove(handler)
+            handlers = self._message_handlers
+
+        if channel_or_type in handlers:
+            remaining = list(handlers[channel_or_type])
+            remaining.remove(handler)
+            handlers[channel_or_type] = tuple(remaining)
 
     async def _heartbeat_loop(self) -> None:
         """Send periodic heartbeat to keep connection alive."""
@@ -564,7 +570,8 @@ class WebSocketClient:
                 await asyncio.sleep(60)  # Check every 60 seconds
 
                 # Check if we received a heartbeat recently
-                current_time = asyncio.get_event_loop().time()
+                loop = self._loop or asyncio.get_running_loop()
+                current_time = loop.time()
                 if self._last_heartbeat > 0:
                     time_since_heartbeat = current_time - self._last_heartbeat
                     if time_since_heartbeat > 120:  # No heartbeat for 2 minutes
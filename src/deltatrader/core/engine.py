@@ -54,6 +54,7 @@ class TradingEngine:
         # Tasks
         self._tick_task: asyncio.Task | None = None
         self._running = False
+        self._stop_event = asyncio.Event()
 
         # Products
         self.products: list[Product] = []
@@ -135,6 +136,7 @@ class TradingEngine:
             return
 
         self._running = True
+        self._stop_event.clear()
         logger.info("Starting trading engine...")
 
         # Start all strategies
@@ -156,6 +158,7 @@ class TradingEngine:
 
         logger.info("Stopping trading engine...")
         self._running = False
+        self._stop_event.set()
 
         # Stop tick loop
         if self._tick_task:
@@ -169,9 +172,10 @@ class TradingEngine:
         for strategy in self.strategies:
             await strategy.stop()
 
-        # Stop order subscriptions if using live trading
+        # Stop order subscriptions and batching if using live trading
         if isinstance(self.order_manager, LiveOrderManager):
             await self.order_manager.stop_order_subscriptions()
+            await self.order_manager.stop_batching()
 
         # Stop order reconciliation
         await self.order_manager.stop_reconciliation()
@@ -180,6 +184,10 @@ class TradingEngine:
         logger.info("Cancelling all open orders...")
         await self.order_manager.cancel_all_orders()
 
+        # Release live order manager worker threads
+        if isinstance(self.order_manager, LiveOrderManager):
+            await self.order_manager.close()
+
         # Disconnect clients
         await self.ws_client.disconnect()
         await self.rest_client.close()
@@ -195,15 +203,18 @@ class TradingEngine:
             while self._running:
                 await asyncio.sleep(1.0)  # 1 second tick
 
-                # Call on_tick for all strategies
-                for strategy in self.strategies:
-                    if strategy.is_running:
-                        try:
-                            await strategy.on_tick()
-                        except Exception as e:
-                            logger.error(
-                                f"Error in {strategy.name}.on_tick: {e}", exc_info=True
-                            )
+                # Call on_tick for all running strategies concurrently
+                running = [s for s in self.strategies if s.is_running]
+                results = await asyncio.gather(
+                    *(strategy.on_tick() for strategy in running),
+                    return_exceptions=True,
+                )
+                for strategy, result in zip(running, results, strict=True):
+                    if isinstance(result, Exception):
+                        logger.error(
+                            f"Error in {strategy.name}.on_tick: {result}",
+                            exc_info=result,
+                        )
 
         except asyncio.CancelledError:
             logger.debug("Tick loop cancelled")
@@ -218,9 +229,8 @@ class TradingEngine:
             await self.start()
             logger.info("Trading engine running. Press Ctrl+C to stop.")
 
-            # Keep running until interrupted
-            while self._running:
-                await asyncio.sleep(1.0)
+            # Keep running until stopped or interrupted
+            await self._stop_event.wait()
 
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt received")
@@ -332,6 +342,8 @@ class TradingEngine:
                 "ws_order_updates": 0,
                 "ws_fill_updates": 0,
                 "reconciliation_discrepancies": 0,
+                "reconciliations_skipped": 0,
+                "suppressed_ws_errors": 0,
                 "ws_subscribed": False,
                 "reconciliation_interval": 30,
             }
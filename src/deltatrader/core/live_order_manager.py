@@ -1,19 +1,66 @@
 import asyncio
-import uuid
-from datetime import datetime
+import logging
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
-from ..client.rest import RestClient
-from ..models.order import Order, OrderStatus
+from ..client.rest import RestApiError, RestClient
+from ..models.order import _STATUS_MAP, Order, OrderStatus
+from ..utils.config import Config
 from ..utils.integer_conversion import IntegerConverter
-from ..utils.logger import logger
-from ..utils.timing import get_timestamp_us
-from .order_manager import OrderManager
+from ..utils.logger import LogRateLimiter, logger
+from ..utils.timing import get_timestamp_us, parse_delta_iso_us
+from .order_manager import _CLOSED_STATES, OrderManager
 
 if TYPE_CHECKING:
     from ..client.websocket import WebSocketClient
 
 
+# Responses that mean the exchange wants us to slow down
+_THROTTLE_STATUSES = frozenset({429, 503})
+
+# Reconciliation interval backs off up to this multiple when throttled
+_MAX_BACKOFF_FACTOR = 10
+
+# Recent fill IDs remembered to drop fills replayed after a reconnect
+_FILL_ID_HISTORY = 1024
+
+# Open-order responses larger than this are parsed off the event loop
+_BULK_PARSE_THRESHOLD = 50
+
+# Reconciliation passes are skipped while WebSocket updates arrived within this
+# many seconds and few orders are open, but never more than N passes in a row
+_WS_HEALTHY_AGE = 30.0
+_SKIP_MAX_OPEN_ORDERS = 100
+_MAX_SKIPPED_RECONCILIATIONS = 3
+
+# Client order IDs generated per os.urandom call (16 random bytes each)
+_CID_POOL_SIZE = 256
+
+
+def _bulk_parse(response: list[dict], converter: IntegerConverter) -> list[Order]:
+    """Parse REST order data into Orders, skipping entries without a client ID."""
+    from_api = Order.from_api
+    debug = logger.isEnabledFor(logging.DEBUG)
+    orders: list[Order] = []
+    append = orders.append
+    for order_data in response:
+        if debug:
+            logger.debug("GET OPEN ORDERS RESPONSE -> %s", order_data)
+        try:
+            order = from_api(order_data, converter)
+        except Exception as e:
+            logger.warning(f"Failed to parse order: {e}")
+            continue
+        if order.client_order_id:
+            append(order)
+    return orders
+
+
 class LiveOrderManager(OrderManager):
     """Live order manager using REST API and WebSocket for real-time updates."""
 
@@ -36,6 +83,11 @@ class LiveOrderManager(OrderManager):
         self.ws_client = ws_client
         self._reconciliation_task: asyncio.Task | None = None
         self._reconciliation_interval = 300  # 5 minutes (as backup/risk check)
+        self._current_interval: float = self._reconciliation_interval
+        self._backoff_factor = 1
+        self._throttle_error: RestApiError | None = None
+        # Wakes the reconciliation loop early (on stop or a staleness hint)
+        self._reconciliation_wakeup = asyncio.Event()
         self._running = False
         self._ws_subscribed = False
 
@@ -43,13 +95,57 @@ class LiveOrderManager(OrderManager):
         self._ws_order_updates = 0
         self._ws_fill_updates = 0
         self._reconciliation_discrepancies = 0
+        self._reconciliations_skipped = 0
+
+        # Monotonic time of the last applied WebSocket order/fill update
+        self._last_ws_update = 0.0
+        self._consecutive_skips = 0
+
+        # Recently applied fill IDs (set for lookup, deque for eviction order)
+        self._seen_fill_ids: set = set()
+        self._fill_id_history: deque = deque()
+
+        # Pre-generated client order IDs, refilled in bulk when empty
+        self._cid_pool: deque[str] = deque()
+
+        # Tracebacks from WebSocket handlers are rate limited to 5/s
+        self._ws_error_limiter = LogRateLimiter(rate=5.0)
+
+        # Orders queued by submit_order, drained in batches by _batch_dispatcher
+        self._place_queue: asyncio.Queue[tuple[Order, asyncio.Future[Order]]] = (
+            asyncio.Queue()
+        )
+        self._batch_task: asyncio.Task | None = None
+
+        # Worker threads for parsing large REST responses, created on first
+        # use and shut down by close()
+        self._parse_pool: ThreadPoolExecutor | None = None
 
         # Register WebSocket handlers if client provided
         if self.ws_client:
             self.ws_client.add_handler("orders", self._handle_order_update)
             self.ws_client.add_handler("fills", self._handle_fill_update)
+            self.ws_client.add_handler("reconnect", self._handle_ws_reconnect)
             logger.info("WebSocket order update handlers registered")
 
+    async def __aenter__(self):
+        """Context manager entry - opens the shared REST session."""
+        await self.rest_client.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - stops background tasks and closes the session."""
+        await self.stop_batching()
+        await self.stop_reconciliation()
+        await self.rest_client.close()
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the response parsing threads (recreated if needed again)."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False)
+            self._parse_pool = None
+
     async def place_order(self, order: Order) -> Order:
         """
         Place a new order via REST API.
@@ -70,11 +166,9 @@ class LiveOrderManager(OrderManager):
 
             # Generate client order ID if not set (max 32 chars for Delta Exchange)
             if not order.client_order_id:
-                # Use UUID hex (32 chars) instead of full UUID string (36 chars with hyphens)
-                order.client_order_id = uuid.uuid4().hex
+                order.client_order_id = self._next_client_order_id()
 
             # Convert to API payload
-            size_str = self.converter.integer_to_size(order.size)
             price_str = None
             if order.price is not None:
                 price_str = self.converter.integer_to_price(order.symbol, order.price)
@@ -82,33 +176,14 @@ class LiveOrderManager(OrderManager):
             # Place order
             response = await self.rest_client.place_order(
                 product_id=product_id,
-                size=int(float(size_str)),  # API expects integer contract count
+                size=self.converter.integer_to_contract_count(order.size),
                 side=order.side,
                 order_type=order.order_type,
                 limit_price=price_str,
                 client_order_id=order.client_order_id,
             )
 
-            # Update order with response
-            order.exchange_order_id = int(response.get("id", ""))
-            order.product_id = product_id
-            order.status = self._map_api_status(response.get("state", "open"))
-
-            # Parse timestamp - API returns ISO format string like '2026-02-07T12:22:51.882176Z'
-            created_at = response.get("created_at")
-            if created_at and isinstance(created_at, str):
-                try:
-                    # Parse ISO format and convert to microseconds
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    order.timestamp = int(dt.timestamp() * 1_000_000)
-                except (ValueError, AttributeError):
-                    order.timestamp = get_timestamp_us()
-            else:
-                order.timestamp = get_timestamp_us()
-
-            # Store order
-            if order.client_order_id:
-                self._orders[order.client_order_id] = order
+            self._apply_place_response(order, product_id, response)
 
             logger.info(
                 f"Order placed: {order.symbol} {order.side} {order.size} @ {order.price} - Exchange Order ID: {order.exchange_order_id}"
@@ -117,9 +192,212 @@ class LiveOrderManager(OrderManager):
 
         except Exception as e:
             logger.error(f"Failed to place order: {e}", exc_info=True)
-            order.status = "rejected"
+            self._set_status(order, "rejected")
             return order
 
+    def _apply_place_response(
+        self, order: Order, product_id: int, response: dict
+    ) -> None:
+        """
+        Update an order from a placement response and store it.
+
+        Args:
+            order: Order that was placed
+            product_id: Product ID the order was placed on
+            response: Order data returned by the exchange
+        """
+        order.exchange_order_id = int(response.get("id", ""))
+        order.product_id = product_id
+        order.status = self._map_api_status(response.get("state", "open"))
+
+        # Parse timestamp - API returns ISO format string like '2026-02-07T12:22:51.882176Z'
+        created_at = response.get("created_at")
+        if created_at and isinstance(created_at, str):
+            try:
+                order.timestamp = parse_delta_iso_us(created_at)
+            except ValueError:
+                order.timestamp = get_timestamp_us()
+        else:
+            order.timestamp = get_timestamp_us()
+
+        # Store order
+        if order.client_order_id:
+            self._orders[order.client_order_id] = order
+
+    async def place_orders(self, orders: list[Order]) -> list[Order]:
+        """
+        Place several orders using the batch endpoint.
+
+        Orders are grouped by product and sent in chunks of
+        Config.ORDER_BATCH_MAX, one request per chunk. Orders missing from
+        the exchange response are marked rejected.
+
+        Args:
+            orders: Orders to place
+
+        Returns:
+            The same orders, updated with IDs and status
+        """
+        by_product: dict[int, list[Order]] = {}
+        for order in orders:
+            product_id = self.get_product_id(order.symbol)
+            if product_id is None:
+                logger.error(f"Product not registered: {order.symbol}")
+                order.status = "rejected"
+                continue
+            if not order.client_order_id:
+                order.client_order_id = self._next_client_order_id()
+            by_product.setdefault(product_id, []).append(order)
+
+        batch_max = Config.ORDER_BATCH_MAX
+        for product_id, product_orders in by_product.items():
+            for start in range(0, len(product_orders), batch_max):
+                chunk = product_orders[start : start + batch_max]
+                payloads = []
+                for order in chunk:
+                    payload = {
+                        "size": self.converter.integer_to_contract_count(order.size),
+                        "side": order.side,
+                        "order_type": order.order_type,
+                        "client_order_id": order.client_order_id,
+                    }
+                    if order.price is not None:
+                        payload["limit_price"] = self.converter.integer_to_price(
+                            order.symbol, order.price
+                        )
+                    payloads.append(payload)
+
+                try:
+                    results = await self.rest_client.place_batch_orders(
+                        product_id, payloads
+                    )
+                except Exception as e:
+                    logger.error(
+                        f"Failed to place batch of {len(chunk)} orders: {e}",
+                        exc_info=True,
+                    )
+                    for order in chunk:
+                        order.status = "rejected"
+                    continue
+
+                by_client_id = {r.get("client_order_id"): r for r in results}
+                for order in chunk:
+                    response = by_client_id.get(order.client_order_id)
+                    if response is None:
+                        logger.warning(
+                            f"Batch response missing order {order.client_order_id}"
+                        )
+                        order.status = "rejected"
+                        continue
+                    self._apply_place_response(order, product_id, response)
+
+        logger.info(f"Batch placement complete: {len(orders)} orders")
+        return orders
+
+    async def submit_order(self, order: Order) -> Order:
+        """
+        Queue an order for coalesced placement.
+
+        Orders submitted within Config.ORDER_BATCH_WINDOW of each other are
+        sent together via place_orders; a lone order goes through place_order.
+
+        Args:
+            order: Order to place
+
+        Returns:
+            Updated order with ID and status
+        """
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = asyncio.create_task(self._batch_dispatcher())
+
+        future: asyncio.Future[Order] = asyncio.get_running_loop().create_future()
+        self._place_queue.put_nowait((order, future))
+        return await future
+
+    async def stop_batching(self) -> None:
+        """Stop the order batch dispatcher."""
+        if self._batch_task:
+            self._batch_task.cancel()
+            await asyncio.gather(self._batch_task, return_exceptions=True)
+            self._batch_task = None
+
+    async def _batch_dispatcher(self) -> None:
+        """Drain queued orders in bursts and place each burst in one request."""
+        batch: list[tuple[Order, asyncio.Future[Order]]] = []
+        try:
+            while True:
+                batch = [await self._place_queue.get()]
+
+                # Let concurrent submitters join this batch
+                await asyncio.sleep(Config.ORDER_BATCH_WINDOW)
+                while (
+                    len(batch) < Config.ORDER_BATCH_MAX
+                    and not self._place_queue.empty()
+                ):
+                    batch.append(self._place_queue.get_nowait())
+
+                orders = [order for order, _ in batch]
+                try:
+                    if len(orders) == 1:
+                        await self.place_order(orders[0])
+                    else:
+                        await self.place_orders(orders)
+                except Exception as e:
+                    logger.error(f"Error placing order batch: {e}", exc_info=True)
+                    for order in orders:
+                        order.status = "rejected"
+
+                for order, future in batch:
+                    if not future.done():
+                        future.set_result(order)
+                batch = []
+
+        except asyncio.CancelledError:
+            logger.debug("Order batch dispatcher cancelled")
+        finally:
+            # Fail anything still waiting so callers don't hang
+            while not self._place_queue.empty():
+                batch.append(self._place_queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.cancel()
+
+    async def cancel_orders(self, client_order_ids: list[str]) -> int:
+        """
+        Cancel several orders using the batch endpoint.
+
+        Args:
+            client_order_ids: Client order IDs to cancel
+
+        Returns:
+            Number of orders cancelled
+        """
+        by_product: dict[int, list[str]] = {}
+        for client_order_id in client_order_ids:
+            order = self._orders.get(client_order_id)
+            if order is None or not order.product_id:
+                logger.warning(f"Cannot batch cancel unknown order: {client_order_id}")
+                continue
+            by_product.setdefault(order.product_id, []).append(client_order_id)
+
+        count = 0
+        batch_max = Config.ORDER_BATCH_MAX
+        for product_id, ids in by_product.items():
+            for start in range(0, len(ids), batch_max):
+                chunk = ids[start : start + batch_max]
+                try:
+                    await self.rest_client.cancel_batch_orders(product_id, chunk)
+                except Exception as e:
+                    logger.error(f"Failed to cancel batch of {len(chunk)} orders: {e}")
+                    continue
+
+                for client_order_id in chunk:
+                    self._set_status(self._orders[client_order_id], "cancelled")
+                count += len(chunk)
+
+        logger.info(f"Batch cancelled {count} orders")
+        return count
+
     async def cancel_order(self, client_order_id: str) -> bool:
         """
         Cancel an order via REST API.
@@ -135,8 +413,18 @@ class LiveOrderManager(OrderManager):
             product_id: int | None = None
 
             if client_order_id in self._orders:
-                product_id = self._orders[client_order_id].product_id
-                product_symbol = self._orders[client_order_id].symbol
+                order = self._orders[client_order_id]
+                # WebSocket already reported a terminal state, so a REST
+                # cancel would only come back 404
+                if order.status in _CLOSED_STATES:
+                    logger.debug(
+                        f"Order {client_order_id} already {order.status}, "
+                        "skipping cancel request"
+                    )
+                    return True
+
+                product_id = order.product_id
+                product_symbol = order.symbol
                 logger.debug(
                     f"CANCELLING ORDER -> ClientOrderID: {client_order_id}, ProductId: {product_id}, ProductSymbol: {product_symbol}"
                 )
@@ -149,7 +437,7 @@ class LiveOrderManager(OrderManager):
 
             # Update local order status
             if client_order_id in self._orders:
-                self._orders[client_order_id].status = "cancelled"
+                self._set_status(self._orders[client_order_id], "cancelled")
 
             logger.info(f"Order cancelled: {client_order_id}")
             return True
@@ -161,7 +449,7 @@ class LiveOrderManager(OrderManager):
                     f"Order {client_order_id} already cancelled or filled (404)"
                 )
                 if client_order_id in self._orders:
-                    self._orders[client_order_id].status = "cancelled"
+                    self._set_status(self._orders[client_order_id], "cancelled")
                 return True
 
             logger.error(f"Failed to cancel order {client_order_id}: {e}")
@@ -178,19 +466,15 @@ class LiveOrderManager(OrderManager):
             Number of orders cancelled
         """
         try:
-            product_id = None
-            if symbol:
-                product_id = self.get_product_id(symbol)
+            product_id = self._product_map.get(symbol) if symbol else None
 
             await self.rest_client.cancel_all_orders(product_id=product_id)
 
-            # Update local order statuses
+            # Update local order statuses (only open orders are visited)
             count = 0
-            for order in self._orders.values():
-                if symbol is None or order.symbol == symbol:
-                    if order.status == "open" or order.status == "pending":
-                        order.status = "cancelled"
-                        count += 1
+            for order in self._orders.open_orders(symbol):
+                self._set_status(order, "cancelled")
+                count += 1
 
             logger.info(f"Cancelled {count} orders for {symbol or 'all symbols'}")
             return count
@@ -216,21 +500,39 @@ class LiveOrderManager(OrderManager):
 
             response = await self.rest_client.get_open_orders(product_id=product_id)
 
-            # Parse orders
-            orders = []
-            for order_data in response:
-                try:
-                    logger.debug(f"GET OPEN ORDERS RESPONSE -> {order_data}")
-                    order = Order.from_api(order_data, self.converter)
-                    if not order.client_order_id:
-                        continue
-                    self._orders[order.client_order_id] = order
-                    orders.append(order)
-                except Exception as e:
-                    logger.warning(f"Failed to parse order: {e}")
+            # Parse orders, off the event loop for large responses so WS
+            # updates are not held up behind the parse
+            if len(response) > _BULK_PARSE_THRESHOLD:
+                if self._parse_pool is None:
+                    self._parse_pool = ThreadPoolExecutor(
+                        max_workers=2, thread_name_prefix="order-parse"
+                    )
+                loop = asyncio.get_running_loop()
+                orders = await loop.run_in_executor(
+                    self._parse_pool, _bulk_parse, response, self.converter
+                )
+            else:
+                orders = _bulk_parse(response, self.converter)
+
+            # Store on the event loop thread so _orders needs no locking
+            store = self._orders
+            for order in orders:
+                # _bulk_parse already drops orders without a client ID
+                if order.client_order_id is not None:
+                    store[order.client_order_id] = order
 
             return orders
 
+        except RestApiError as e:
+            if e.status not in _THROTTLE_STATUSES:
+                logger.error(f"Failed to get open orders: {e}")
+                return []
+            # Surface throttling so reconciliation backs off instead of
+            # treating every local order as gone from the exchange
+            logger.warning(f"Open orders request throttled: {e}")
+            self._throttle_error = e
+            raise
+
         except Exception as e:
             logger.error(f"Failed to get open orders: {e}")
             return []
@@ -281,7 +583,6 @@ class LiveOrderManager(OrderManager):
 
         try:
             # Convert to API format
-            size_str = self.converter.integer_to_size(size)
             price_str = None
             if price is not None:
                 price_str = self.converter.integer_to_price(old_order.symbol, price)
@@ -290,20 +591,20 @@ class LiveOrderManager(OrderManager):
             response = await self.rest_client.edit_order(
                 order_id=str(old_order.exchange_order_id),
                 product_id=old_order.product_id,
-                size=int(float(size_str)),
+                size=self.converter.integer_to_contract_count(size),
                 limit_price=price_str,
             )
 
             # Update local order with response
             old_order.size = size
             old_order.price = price
-            old_order.status = self._map_api_status(response.get("state", "open"))
+            self._set_status(
+                old_order, self._map_api_status(response.get("state", "open"))
+            )
 
             # Update filled size if provided
             if "unfilled_size" in response:
-                unfilled = self.converter.size_to_integer(
-                    str(response["unfilled_size"])
-                )
+                unfilled = self.converter.size_to_integer(response["unfilled_size"])
                 old_order.filled_size = size - unfilled
 
             logger.info(f"Order edited successfully: {client_order_id}")
@@ -358,8 +659,9 @@ class LiveOrderManager(OrderManager):
             data: WebSocket message with order update
         """
         try:
-            msg_type = data.get("type")
-            logger.debug(f"Order update received: {msg_type} - {data}")
+            msg_type: str = data.get("type", "")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Order update received: {msg_type} - {data}")
 
             # Extract order details (handle both nested and flat structures)
             order_data = data.get("order", data)
@@ -389,44 +691,23 @@ class LiveOrderManager(OrderManager):
             # Update order status based on message type
             old_status = order.status
 
-            if msg_type in ["order_created", "order_open"]:
-                order.status = "open"
-
-            elif msg_type == "order_closed":
-                # Order closed - check if filled or cancelled
-                filled_size = self.converter.size_to_integer(
-                    str(order_data.get("size", 0))
-                )
-                if filled_size > 0:
-                    order.status = "filled"
-                    order.filled_size = filled_size
-                    order.average_fill_price = self.converter.price_to_integer(
-                        order.symbol, str(order_data.get("average_fill_price", 0))
-                    )
-                else:
-                    order.status = "cancelled"
-
-            elif msg_type == "order_cancelled":
-                order.status = "cancelled"
-
-            elif msg_type == "order_rejected":
-                order.status = "rejected"
+            transition = self._ORDER_TRANSITIONS.get(msg_type)
+            if transition is not None:
+                transition(self, order, order_data)
 
             # Update filled size and average fill price if provided
             if "size" in order_data and order.status == "filled":
-                order.filled_size = self.converter.size_to_integer(
-                    str(order_data.get("size"))
-                )
+                order.filled_size = self._cached_size(order, "size", order_data["size"])
 
             if "unfilled_size" in order_data:
-                unfilled = self.converter.size_to_integer(
-                    str(order_data.get("unfilled_size"))
+                unfilled = self._cached_size(
+                    order, "unfilled_size", order_data["unfilled_size"]
                 )
                 order.filled_size = order.size - unfilled
 
             if "average_fill_price" in order_data and order_data["average_fill_price"]:
-                order.average_fill_price = self.converter.price_to_integer(
-                    order.symbol, str(order_data["average_fill_price"])
+                order.average_fill_price = self._cached_price(
+                    order, "average_fill_price", order_data["average_fill_price"]
                 )
 
             # Log status change
@@ -448,9 +729,59 @@ class LiveOrderManager(OrderManager):
                     )
 
             self._ws_order_updates += 1
+            self._last_ws_update = time.monotonic()
 
         except Exception as e:
-            logger.error(f"Error handling order update: {e}", exc_info=True)
+            if self._ws_error_limiter.try_acquire():
+                logger.error(f"Error handling order update: {e}", exc_info=True)
+
+    def _on_order_open(self, order: Order, order_data: dict) -> None:
+        self._set_status(order, "open")
+
+    def _on_order_closed(self, order: Order, order_data: dict) -> None:
+        # Order closed - check if filled or cancelled
+        filled_size = self._cached_size(order, "size", order_data.get("size", 0))
+        if filled_size > 0:
+            self._set_status(order, "filled")
+            order.filled_size = filled_size
+            order.average_fill_price = self._cached_price(
+                order, "average_fill_price", order_data.get("average_fill_price", 0)
+            )
+        else:
+            self._set_status(order, "cancelled")
+
+    def _on_order_cancelled(self, order: Order, order_data: dict) -> None:
+        self._set_status(order, "cancelled")
+
+    def _on_order_rejected(self, order: Order, order_data: dict) -> None:
+        self._set_status(order, "rejected")
+
+    # WS order message type -> status transition, looked up once per message
+    _ORDER_TRANSITIONS: dict[str, Callable[["LiveOrderManager", Order, dict], None]] = {
+        "order_created": _on_order_open,
+        "order_open": _on_order_open,
+        "order_closed": _on_order_closed,
+        "order_cancelled": _on_order_cancelled,
+        "order_rejected": _on_order_rejected,
+    }
+
+    def _cached_size(self, order: Order, key: str, raw: str | int | float) -> int:
+        """Convert a raw size field, reusing the last result if it is unchanged."""
+        cached = order._raw_cache.get(key)
+        if cached is not None and cached[0] == raw and type(cached[0]) is type(raw):
+            return cached[1]
+        value = self.converter.size_to_integer(raw)
+        order._raw_cache[key] = (raw, value)
+        return value
+
+    def _cached_price(self, order: Order, key: str, raw: object) -> int:
+        """Convert a raw price field, reusing the last result if it is unchanged."""
+        cached = order._raw_cache.get(key)
+        if cached is not None and cached[0] == raw and type(cached[0]) is type(raw):
+            return cached[1]
+        value = self.converter.price_to_integer(order.symbol, str(raw))
+        order._raw_cache[key] = (raw, value)
+        return value
 
     async def _handle_fill_update(self, data: dict) -> None:
         """
@@ -462,7 +793,8 @@ class LiveOrderManager(OrderManager):
             data: WebSocket message with fill details
         """
         try:
-            logger.debug(f"Fill update received: {data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Fill update received: {data}")
 
             # Extract fill details
             fill_data = data.get("fill", data)
@@ -472,33 +804,41 @@ class LiveOrderManager(OrderManager):
                 logger.warning(f"Fill update for unknown order: {client_order_id}")
                 return
 
+            # Skip fills already applied (replayed after a reconnect)
+            fill_id = fill_data.get("id")
+            if fill_id is not None and fill_id in self._seen_fill_ids:
+                logger.debug(f"Ignoring duplicate fill {fill_id} for {client_order_id}")
+                return
+
             order = self._orders[client_order_id]
 
             # Update fill information
-            fill_size = self.converter.size_to_integer(str(fill_data.get("size", 0)))
+            fill_size = self.converter.size_to_integer(fill_data.get("size", 0))
             fill_price = self.converter.price_to_integer(
                 order.symbol, str(fill_data.get("price", 0))
             )
 
-            # Update order filled size
-            order.filled_size = min(order.filled_size + fill_size, order.size)
+            # Re-seed the notional if fills were recorded elsewhere (REST
+            # snapshot, order update) since the last fill message
+            if order._notional_size != order.filled_size:
+                order._notional = (order.average_fill_price or 0) * order.filled_size
 
-            # Update average fill price (weighted average)
-            if order.average_fill_price:
-                # Calculate weighted average
-                total_value = (
-                    order.average_fill_price * (order.filled_size - fill_size)
-                    + fill_price * fill_size
-                )
-                order.average_fill_price = total_value // order.filled_size
-            else:
-                order.average_fill_price = fill_price
+            # Update filled size and average fill price incrementally
+            filled = order.filled_size + fill_size
+            order._notional += fill_price * fill_size
+            if filled:
+                order.average_fill_price = order._notional // filled
+            order.filled_size = min(filled, order.size)
+            order._notional_size = order.filled_size
+
+            if fill_id is not None:
+                self._remember_fill_id(fill_id)
 
             # Update status
             if order.filled_size >= order.size:
-                order.status = "filled"
+                self._set_status(order, "filled")
             else:
-                order.status = "partially_filled"
+                self._set_status(order, "partially_filled")
 
             logger.info(
                 f"Fill update (WebSocket): {client_order_id} - "
@@ -508,9 +848,30 @@ class LiveOrderManager(OrderManager):
             )
 
             self._ws_fill_updates += 1
+            self._last_ws_update = time.monotonic()
 
         except Exception as e:
-            logger.error(f"Error handling fill update: {e}", exc_info=True)
+            if self._ws_error_limiter.try_acquire():
+                logger.error(f"Error handling fill update: {e}", exc_info=True)
+
+    def _next_client_order_id(self) -> str:
+        """
+        Take a client order ID from the pool, refilling it when empty.
+
+        IDs are 32 hex chars (16 random bytes, like uuid4().hex), drawn from
+        a single os.urandom call per _CID_POOL_SIZE orders.
+        """
+        if not self._cid_pool:
+            buf = os.urandom(16 * _CID_POOL_SIZE)
+            self._cid_pool.extend(buf[i : i + 16].hex() for i in range(0, len(buf), 16))
+        return self._cid_pool.popleft()
+
+    def _remember_fill_id(self, fill_id) -> None:
+        """Record an applied fill ID, forgetting the oldest beyond the limit."""
+        if len(self._fill_id_history) >= _FILL_ID_HISTORY:
+            self._seen_fill_ids.discard(self._fill_id_history.popleft())
+        self._fill_id_history.append(fill_id)
+        self._seen_fill_ids.add(fill_id)
 
     def _create_order_from_ws_data(self, order_data: dict) -> Order | None:
         """
@@ -523,18 +884,25 @@ class LiveOrderManager(OrderManager):
             Order object or None if data is insufficient
         """
         try:
-            # Extract required fields
+            # Extract required fields; resolve the symbol from a registered
+            # product ID when the message only carries the ID
+            product_id = order_data.get("product_id") or order_data.get(
+                "product", {}
+            ).get("id")
             symbol = order_data.get("product", {}).get("symbol") or order_data.get(
                 "symbol"
             )
+            if not symbol and product_id:
+                symbol = self.get_symbol(int(product_id))
             if not symbol:
                 return None
+            symbol = sys.intern(symbol)
 
             order = Order(
                 symbol=symbol,
                 side=order_data.get("side", "buy"),
                 order_type=order_data.get("order_type", "limit_order"),
-                size=self.converter.size_to_integer(str(order_data.get("size", 0))),
+                size=self.converter.size_to_integer(order_data.get("size", 0)),
                 price=self.converter.price_to_integer(
                     symbol, str(order_data.get("limit_price", 0))
                 )
@@ -548,21 +916,18 @@ class LiveOrderManager(OrderManager):
             order.status = self._map_api_status(order_data.get("state", "open"))
 
             # Set product ID
-            product_id = order_data.get("product_id") or order_data.get(
-                "product", {}
-            ).get("id")
             if product_id:
                 order.product_id = int(product_id)
 
             # Set filled size
             if "size" in order_data:
                 order.filled_size = self.converter.size_to_integer(
-                    str(order_data.get("size", 0))
+                    order_data.get("size", 0)
                 )
 
             if "unfilled_size" in order_data:
                 unfilled = self.converter.size_to_integer(
-                    str(order_data.get("unfilled_size", 0))
+                    order_data.get("unfilled_size", 0)
                 )
                 order.filled_size = order.size - unfilled
 
@@ -570,9 +935,8 @@ class LiveOrderManager(OrderManager):
             created_at = order_data.get("created_at")
             if created_at and isinstance(created_at, str):
                 try:
-                    dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                    order.timestamp = int(dt.timestamp() * 1_000_000)
-                except (ValueError, AttributeError):
+                    order.timestamp = parse_delta_iso_us(created_at)
+                except ValueError:
                     order.timestamp = get_timestamp_us()
             else:
                 order.timestamp = get_timestamp_us()
@@ -580,9 +944,10 @@ class LiveOrderManager(OrderManager):
             return order
 
         except Exception as e:
-            logger.error(
-                f"Error creating order from WebSocket data: {e}", exc_info=True
-            )
+            if self._ws_error_limiter.try_acquire():
+                logger.error(
+                    f"Error creating order from WebSocket data: {e}", exc_info=True
+                )
             return None
 
     async def start_reconciliation(self) -> None:
@@ -597,7 +962,11 @@ class LiveOrderManager(OrderManager):
             logger.warning("Order reconciliation already running")
             return
 
+        # Open the shared REST session up front rather than on the first request
+        await self.rest_client.connect()
+
         self._running = True
+        self._reconciliation_wakeup.clear()
         self._reconciliation_task = asyncio.create_task(self._reconciliation_loop())
 
         if self.ws_client:
@@ -620,12 +989,16 @@ class LiveOrderManager(OrderManager):
 
         logger.info("Stopping order reconciliation...")
         self._running = False
+        self._reconciliation_wakeup.set()
 
+        # The loop wakes immediately; give an in-flight pass up to the REST
+        # timeout to finish before cancelling it
         if self._reconciliation_task:
-            self._reconciliation_task.cancel()
             try:
-                await self._reconciliation_task
-            except asyncio.CancelledError:
+                await asyncio.wait_for(
+                    self._reconciliation_task, timeout=Config.REST_TIMEOUT
+                )
+            except (asyncio.TimeoutError, asyncio.CancelledError):
                 pass
 
         logger.info("Order reconciliation stopped")
@@ -639,10 +1012,28 @@ class LiveOrderManager(OrderManager):
         """
         try:
             while self._running:
-                await asyncio.sleep(self._reconciliation_interval)
+                # Sleep for the interval, waking early on stop or a hint
+                requested = False
+                try:
+                    await asyncio.wait_for(
+                        self._reconciliation_wakeup.wait(), self._current_interval
+                    )
+                    requested = True
+                except asyncio.TimeoutError:
+                    pass
+                self._reconciliation_wakeup.clear()
+                if not self._running:
+                    break
+
+                # Requested passes always run: WebSocket state is suspect
+                if not requested and self._should_skip_reconciliation():
+                    logger.debug("Skipping reconciliation, WebSocket updates healthy")
+                    continue
 
                 try:
+                    self._throttle_error = None
                     stats = await self.reconcile_orders()
+                    self._update_backoff()
 
                     # Log as risk check if WebSocket is active
                     if self.ws_client and self._ws_subscribed:
@@ -675,6 +1066,60 @@ class LiveOrderManager(OrderManager):
         except asyncio.CancelledError:
             logger.debug("Reconciliation loop cancelled")
 
+    def request_reconciliation(self) -> None:
+        """Run the next reconciliation pass now instead of at the interval."""
+        self._reconciliation_wakeup.set()
+
+    async def _handle_ws_reconnect(self, data: dict) -> None:
+        """Reconcile after a WebSocket reconnect, since updates may be lost."""
+        if self._running:
+            logger.info("WebSocket reconnected, requesting order reconciliation")
+            self.request_reconciliation()
+
+    def _should_skip_reconciliation(self) -> bool:
+        """
+        Check whether a reconciliation pass can be skipped.
+
+        Passes are skipped while subscribed WebSocket updates are recent and
+        few orders are open. Every (_MAX_SKIPPED_RECONCILIATIONS + 1)th pass
+        still runs so state is verified against REST periodically.
+        """
+        if (
+            self.ws_client
+            and self._ws_subscribed
+            and time.monotonic() - self._last_ws_update < _WS_HEALTHY_AGE
+            and self._orders.open_count() < _SKIP_MAX_OPEN_ORDERS
+            and self._consecutive_skips < _MAX_SKIPPED_RECONCILIATIONS
+        ):
+            self._consecutive_skips += 1
+            self._reconciliations_skipped += 1
+            return True
+
+        self._consecutive_skips = 0
+        return False
+
+    def _update_backoff(self) -> None:
+        """
+        Adjust the reconciliation interval after a pass.
+
+        A throttled pass doubles the interval (capped at _MAX_BACKOFF_FACTOR
+        times the configured interval, and never below Retry-After); a clean
+        pass halves it back towards the configured interval.
+        """
+        error = self._throttle_error
+        if error is not None:
+            self._backoff_factor = min(self._backoff_factor * 2, _MAX_BACKOFF_FACTOR)
+        else:
+            self._backoff_factor = max(self._backoff_factor // 2, 1)
+
+        interval: float = self._reconciliation_interval * self._backoff_factor
+        if error is not None and error.retry_after is not None:
+            interval = max(interval, error.retry_after)
+
+        if interval != self._current_interval:
+            logger.info(f"Reconciliation interval now {interval}s")
+        self._current_interval = interval
+
     def set_reconciliation_interval(self, interval: int) -> None:
         """
         Set the reconciliation interval.
@@ -692,6 +1137,7 @@ class LiveOrderManager(OrderManager):
             interval = 5
 
         self._reconciliation_interval = interval
+        self._current_interval = interval * self._backoff_factor
 
         if self.ws_client and self._ws_subscribed:
             logger.info(
@@ -713,6 +1159,8 @@ class LiveOrderManager(OrderManager):
             "ws_order_updates": self._ws_order_updates,
             "ws_fill_updates": self._ws_fill_updates,
             "reconciliation_discrepancies": self._reconciliation_discrepancies,
+            "reconciliations_skipped": self._reconciliations_skipped,
+            "suppressed_ws_errors": self._ws_error_limiter.suppressed,
             "ws_subscribed": self._ws_subscribed,
             "reconciliation_interval": self._reconciliation_interval,
         }
@@ -720,11 +1168,4 @@ class LiveOrderManager(OrderManager):
     @staticmethod
     def _map_api_status(api_status: str) -> OrderStatus:
         """Map API status to internal status."""
-        status_map: dict[str, OrderStatus] = {
-            "open": "open",
-            "pending": "pending",
-            "closed": "filled",
-            "cancelled": "cancelled",
-            "rejected": "rejected",
-        }
-        return status_map.get(api_status, "pending")
+        return _STATUS_MAP.get(api_status, "pending")
@@ -1,15 +1,26 @@
 """Market data manager for orderbooks and trades."""
 
 import asyncio
+import inspect
+import logging
+import sys
+from collections import defaultdict, deque
 from collections.abc import Callable
+from itertools import islice
 
 from ..client.websocket import WebSocketClient
 from ..models.orderbook import OrderBook
+from ..models.tick import MarketTick
 from ..models.trade import Trade
 from ..utils.config import Config
 from ..utils.integer_conversion import IntegerConverter
 from ..utils.logger import logger
 
+# Pause between unsubscribe and subscribe when resyncing a gapped orderbook;
+# doubles per consecutive resync of a symbol until a snapshot arrives
+_RESYNC_BASE_DELAY = 0.01  # seconds
+_RESYNC_MAX_DELAY = 1.0  # seconds
+
 
 class MarketDataManager:
     """Manages real-time market data (orderbooks and trades) for multiple symbols."""
@@ -27,19 +38,45 @@ class MarketDataManager:
 
         # Market data storage
         self._orderbooks: dict[str, OrderBook] = {}
-        self._trades: dict[str, list[Trade]] = {}
         self._max_trades_per_symbol = 100
-
-        # Callbacks for updates
-        self._orderbook_callbacks: list[Callable] = []
-        self._trade_callbacks: list[Callable] = []
-
-        # Lock for thread-safe access
+        self._trades: defaultdict[str, deque[Trade]] = defaultdict(
+            self._new_trade_history
+        )
+
+        # Callbacks for updates; coroutine functions run as tasks, plain
+        # functions are called inline. Tuples are replaced (not mutated) on
+        # add, so a fanout in progress never sees a half-updated collection.
+        self._orderbook_callbacks: tuple[Callable, ...] = ()
+        self._trade_callbacks: tuple[Callable, ...] = ()
+        self._orderbook_sync_callbacks: tuple[Callable, ...] = ()
+        self._trade_sync_callbacks: tuple[Callable, ...] = ()
+        self._tick_callbacks: tuple[Callable, ...] = ()
+        self._tick_sync_callbacks: tuple[Callable, ...] = ()
+
+        # Serializes structural changes (unsubscribe/cleanup). The WebSocket
+        # handlers skip it: they mutate state without awaiting in between, so
+        # on the single event loop their updates cannot interleave.
         self._lock = asyncio.Lock()
 
         # Track pending snapshot requests
         self._pending_snapshots: dict[str, bool] = {}
 
+        # Orderbook channel name per symbol, fixed at subscribe time
+        self._ob_channels: dict[str, str] = {}
+
+        # Resyncs issued per symbol since its last snapshot
+        self._resync_attempts: dict[str, int] = {}
+
+        # Symbols with an orderbook callback fanout already scheduled
+        self._ob_notify_pending: set[str] = set()
+
+        # Ticks being collected for the current loop pass, flushed by call_soon
+        self._pending_ticks: dict[str, MarketTick] = {}
+
+        # Running async callback tasks, referenced until done so they are not
+        # garbage collected mid-flight
+        self._callback_tasks: set[asyncio.Task] = set()
+
     async def subscribe_orderbook(self, symbol: str) -> None:
         """
         Subscribe to orderbook updates for a symbol.
@@ -59,6 +96,7 @@ class MarketDataManager:
         # Subscribe to configured orderbook channel
         channel_type = Config.ORDERBOOK_CHANNEL
         channel = f"{channel_type}.{symbol}"
+        self._ob_channels[symbol] = channel
         await self.ws_client.subscribe([channel])
 
         # Add handler for this symbol
@@ -73,9 +111,9 @@ class MarketDataManager:
         Args:
             symbol: Trading symbol
         """
-        # Initialize trades list
+        # Initialize bounded trade history
         if symbol not in self._trades:
-            self._trades[symbol] = []
+            self._trades[symbol] = self._new_trade_history()
 
         # Subscribe to all_trades channel
         channel = f"all_trades.{symbol}"
@@ -93,11 +131,12 @@ class MarketDataManager:
         Args:
             symbol: Trading symbol
         """
-        channel_type = Config.ORDERBOOK_CHANNEL
-        channel = f"{channel_type}.{symbol}"
+        channel = self._orderbook_channel(symbol)
         await self.ws_client.unsubscribe([channel])
 
         async with self._lock:
+            self._ob_channels.pop(symbol, None)
+            self._resync_attempts.pop(symbol, None)
             if symbol in self._orderbooks:
                 del self._orderbooks[symbol]
             if symbol in self._pending_snapshots:
@@ -121,6 +160,58 @@ class MarketDataManager:
 
         logger.info(f"Unsubscribed from trades: {symbol}")
 
+    def _orderbook_channel(self, symbol: str) -> str:
+        """Get the cached orderbook channel name for a symbol."""
+        channel = self._ob_channels.get(symbol)
+        if channel is None:
+            channel = f"{Config.ORDERBOOK_CHANNEL}.{symbol}"
+            self._ob_channels[symbol] = channel
+        return channel
+
+    async def _resubscribe_orderbook(self, symbol: str) -> None:
+        """
+        Resubscribe to a symbol's orderbook channel to get a fresh snapshot.
+
+        The message handler stays registered, so only the subscription itself
+        is cycled. The pause in between backs off exponentially while the
+        symbol keeps gapping without receiving a snapshot.
+
+        Args:
+            symbol: Trading symbol
+        """
+        attempts = self._resync_attempts.get(symbol, 0)
+        self._resync_attempts[symbol] = attempts + 1
+        delay = min(_RESYNC_BASE_DELAY * 2**attempts, _RESYNC_MAX_DELAY)
+
+        channel = self._orderbook_channel(symbol)
+        await self.ws_client.unsubscribe([channel])
+        await asyncio.sleep(delay)
+        await self.ws_client.subscribe([channel])
+
+    def _validate_checksum(
+        self, symbol: str, orderbook: OrderBook, checksum: int | None
+    ) -> None:
+        """Validate a message checksum against the book, warning on mismatch."""
+        if not checksum:
+            return
+
+        computed = orderbook.compute_checksum(self.converter)
+        if computed != checksum and logger.isEnabledFor(logging.WARNING):
+            # Build checksum string for debugging (mismatch path only)
+            checksum_string = orderbook.checksum_string()
+            if len(checksum_string) > 200:
+                checksum_string = checksum_string[:200] + "..."
+
+            logger.warning(
+                f"Checksum validation failed for {symbol} "
+                f"(expected={checksum}, computed={computed})\n"
+                f"Checksum string: {checksum_string}"
+            )
+            # Optionally resubscribe on checksum failure (as a task, since
+            # this runs synchronously)
+            # self._pending_snapshots[symbol] = True
+            # self._spawn_callback(self._resubscribe_orderbook(symbol))
+
     async def _handle_orderbook_message(self, data: dict) -> None:
         """
         Handle orderbook update message.
@@ -128,9 +219,12 @@ class MarketDataManager:
         Supports both l2_orderbook and l2_updates channel formats:
         - l2_orderbook: Full snapshots with type="l2_orderbook"
         - l2_updates: Initial snapshot (action="snapshot") + incremental updates (action="update")
+
+        Book state is mutated without awaiting in between, so it does not take _lock.
         """
         try:
-            logger.debug(f"ORDERBOOKMSG: {data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("ORDERBOOKMSG: %s", data)
             # l2_updates messages have BOTH type="l2_updates" AND action="snapshot"/"update"
             # We need to prioritize the action field for l2_updates messages
             action = data.get("action")
@@ -147,95 +241,70 @@ class MarketDataManager:
                 logger.error(f"Orderbook error for {symbol}: {error_msg}")
                 return
 
-            async with self._lock:
-                orderbook = self._orderbooks.get(symbol)
-                if not orderbook:
-                    orderbook = OrderBook(symbol=symbol)
-                    self._orderbooks[symbol] = orderbook
-
-                # Handle l2_orderbook (full snapshot from l2_orderbook channel)
-                if msg_type == "l2_orderbook":
-                    orderbook.update_from_snapshot(data, self.converter)
-                    self._pending_snapshots[symbol] = False
-                    best_bid = orderbook.get_best_bid()
-                    best_ask = orderbook.get_best_ask()
-                    logger.info(
-                        f"Orderbook snapshot (l2_orderbook): {symbol} - "
-                        f"bid={best_bid[0]}/{best_bid[1]}, "
-                        f"ask={best_ask[0]}/{best_ask[1]}, "
-                        f"seq={orderbook.sequence_no}, "
-                        f"bids={len(orderbook.bids)}, asks={len(orderbook.asks)}"
-                    )
+            # Single lookup per dict; a book created here starts out awaiting
+            # its snapshot, as in subscribe_orderbook
+            pending = self._pending_snapshots
+            orderbook = self._orderbooks.get(symbol)
+            if orderbook is None:
+                orderbook = self._orderbooks[symbol] = OrderBook(symbol=symbol)
+                pending[symbol] = True
+            converter = self.converter
+
+            # Handle l2_orderbook (full snapshot from l2_orderbook channel)
+            if msg_type == "l2_orderbook":
+                orderbook.update_from_snapshot(data, converter)
+                pending[symbol] = False
+                self._resync_attempts.pop(symbol, None)
+                if logger.isEnabledFor(logging.INFO):
+                    self._log_snapshot("l2_orderbook", symbol, orderbook)
+
+            # Handle snapshot (from l2_updates channel or legacy format)
+            elif msg_type == "snapshot":
+                orderbook.update_from_snapshot(data, converter)
+                pending[symbol] = False
+                self._resync_attempts.pop(symbol, None)
+                if logger.isEnabledFor(logging.INFO):
+                    self._log_snapshot("l2_updates", symbol, orderbook)
+
+            # Handle incremental update (from l2_updates channel)
+            elif msg_type == "update":
+                # Skip updates until we have a snapshot
+                if pending.get(symbol, True):
+                    logger.debug("Skipping update, waiting for snapshot: %s", symbol)
+                    return
 
-                # Handle snapshot (from l2_updates channel or legacy format)
-                elif msg_type == "snapshot":
-                    orderbook.update_from_snapshot(data, self.converter)
-                    self._pending_snapshots[symbol] = False
-                    best_bid = orderbook.get_best_bid()
-                    best_ask = orderbook.get_best_ask()
-                    logger.info(
-                        f"Orderbook snapshot (l2_updates): {symbol} - "
-                        f"bid={best_bid[0]}/{best_bid[1]}, "
-                        f"ask={best_ask[0]}/{best_ask[1]}, "
-                        f"seq={orderbook.sequence_no}, "
-                        f"bids={len(orderbook.bids)}, asks={len(orderbook.asks)}"
-                    )
+                # Apply update
+                success = orderbook.apply_update(
+                    data, converter, top_levels=Config.ORDERBOOK_NOTIFY_DEPTH
+                )
 
-                # Handle incremental update (from l2_updates channel)
-                elif msg_type == "update":
-                    # Skip updates until we have a snapshot
-                    if self._pending_snapshots.get(symbol, True):
-                        logger.debug(f"Skipping update, waiting for snapshot: {symbol}")
-                        return
-
-                    # Apply update
-                    success = orderbook.apply_update(data, self.converter)
-
-                    if not success:
-                        # Sequence mismatch, need to resubscribe
-                        logger.warning(
-                            f"Sequence mismatch for {symbol}, resubscribing for snapshot"
-                        )
-                        self._pending_snapshots[symbol] = True
-                        channel_type = Config.ORDERBOOK_CHANNEL
-                        channel = f"{channel_type}.{symbol}"
-                        await self.ws_client.unsubscribe([channel])
-                        await asyncio.sleep(0.1)
-                        await self.ws_client.subscribe([channel])
-                        return
-
-                    logger.debug(
-                        f"Applied orderbook update: {symbol} seq={orderbook.sequence_no}"
+                if not success:
+                    # Sequence mismatch, need to resubscribe
+                    logger.warning(
+                        "Sequence mismatch for %s, resubscribing for snapshot", symbol
                     )
+                    pending[symbol] = True
+                    await self._resubscribe_orderbook(symbol)
+                    return
+
+                logger.debug(
+                    "Applied orderbook update: %s seq=%s", symbol, orderbook.sequence_no
+                )
 
-                else:
-                    logger.warning(f"Unknown orderbook message type: {msg_type}")
+                if not orderbook.top_changed:
+                    # Only deeper levels moved: sample the checksum and skip
+                    # the callback fanout
+                    interval = Config.CHECKSUM_SAMPLE_INTERVAL
+                    if interval <= 1 or orderbook.sequence_no % interval == 0:
+                        self._validate_checksum(symbol, orderbook, data.get("cs"))
                     return
 
-                # Validate checksum if provided
-                checksum = data.get("cs")
-                if checksum:
-                    computed = orderbook.compute_checksum(self.converter)
-                    if computed != checksum:
-                        # Build checksum string for debugging
-                        top_raw_asks = orderbook._raw_asks[:10]
-                        top_raw_bids = orderbook._raw_bids[:10]
-                        ask_parts = [f"{price}:{size}" for price, size in top_raw_asks]
-                        bid_parts = [f"{price}:{size}" for price, size in top_raw_bids]
-                        checksum_string = (
-                            ",".join(ask_parts) + "|" + ",".join(bid_parts)
-                        )
-
-                        logger.warning(
-                            f"Checksum validation failed for {symbol} "
-                            f"(expected={checksum}, computed={computed})\n"
-                            f"Checksum string: {checksum_string[:200]}..."
-                            if len(checksum_string) > 200
-                            else f"Checksum string: {checksum_string}"
-                        )
-                        # Optionally resubscribe on checksum failure
-                        # self._pending_snapshots[symbol] = True
-                        # await self._resubscribe_orderbook(symbol)
+            else:
+                logger.warning("Unknown orderbook message type: %s", msg_type)
+                return
+
+            # Validate checksum if provided
+            self._validate_checksum(symbol, orderbook, data.get("cs"))
 
             # Notify callbacks
             await self._notify_orderbook_callbacks(symbol, orderbook)
@@ -243,10 +312,30 @@ class MarketDataManager:
         except Exception as e:
             logger.error(f"Error handling orderbook message: {e}", exc_info=True)
 
+    @staticmethod
+    def _log_snapshot(source: str, symbol: str, orderbook: OrderBook) -> None:
+        """Log a one-line top-of-book summary after a snapshot."""
+        best_bid = orderbook.get_best_bid()
+        best_ask = orderbook.get_best_ask()
+        logger.info(
+            "Orderbook snapshot (%s): %s - bid=%s/%s, ask=%s/%s, seq=%s, "
+            "bids=%d, asks=%d",
+            source,
+            symbol,
+            best_bid[0],
+            best_bid[1],
+            best_ask[0],
+            best_ask[1],
+            orderbook.sequence_no,
+            len(orderbook.bids),
+            len(orderbook.asks),
+        )
+
     async def _handle_trade_message(self, data: dict) -> None:
-        """Handle trade update message."""
+        """Handle trade update message (mutates without awaiting, no _lock)."""
         try:
-            logger.debug(f"TRADEMSG: {data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("TRADEMSG: %s", data)
             msg_type = data.get("type")
             symbol = data.get("symbol")
 
@@ -262,39 +351,39 @@ class MarketDataManager:
                 # Single trade message - the data dict itself is the trade
                 trades_data = [data]
 
-            async with self._lock:
-                if symbol not in self._trades:
-                    self._trades[symbol] = []
-
-                # Parse and store trades
-                new_trades = []
-                for trade_data in trades_data:
-                    try:
-                        trade = Trade.from_api(symbol, trade_data, self.converter)
-                        new_trades.append(trade)
-                    except Exception as e:
-                        logger.warning(f"Failed to parse trade: {e}")
-
-                # Add new trades and maintain max size
-                self._trades[symbol].extend(new_trades)
-                if len(self._trades[symbol]) > self._max_trades_per_symbol:
-                    self._trades[symbol] = self._trades[symbol][
-                        -self._max_trades_per_symbol :
-                    ]
+            trades = self._trades[symbol]
 
-                logger.debug(
-                    f"Trades received: {symbol} ({len(new_trades)} trades) ({msg_type} type)"
-                )
+            # Parse and store trades
+            new_trades = Trade.from_api_many(symbol, trades_data, self.converter)
+
+            # Add new trades; the deque drops the oldest beyond max size
+            trades.extend(new_trades)
+
+            logger.debug(
+                "Trades received: %s (%d trades) (%s type)",
+                symbol,
+                len(new_trades),
+                msg_type,
+            )
 
             # Notify callbacks
             await self._notify_trade_callbacks(symbol, new_trades)
+            if new_trades and (self._tick_callbacks or self._tick_sync_callbacks):
+                self._pending_tick(symbol).trades.extend(new_trades)
 
         except Exception as e:
             logger.error(f"Error handling trade message: {e}", exc_info=True)
 
+    def _new_trade_history(self) -> deque[Trade]:
+        """Create an empty bounded trade history for a new symbol."""
+        return deque(maxlen=self._max_trades_per_symbol)
+
     def get_orderbook(self, symbol: str) -> OrderBook | None:
         """
-        Get current orderbook for a symbol (non-async, returns copy).
+        Get current orderbook for a symbol (non-async).
+
+        Returns the live book, not a copy: it keeps updating as messages
+        arrive and must not be modified by the caller.
 
         Args:
             symbol: Trading symbol
@@ -315,10 +404,26 @@ class MarketDataManager:
         Returns:
             List of Trade objects
         """
-        trades = self._trades.get(symbol, [])
-        if limit:
-            return trades[-limit:]
-        return trades.copy()
+        trades = self._trades.get(symbol)
+        if not trades:
+            return []
+        if limit and limit < len(trades):
+            # Copy only the tail instead of the whole deque
+            return list(islice(trades, len(trades) - limit, None))
+        return list(trades)
+
+    def latest_trade(self, symbol: str) -> Trade | None:
+        """
+        Get the most recent trade for a symbol without copying the history.
+
+        Args:
+            symbol: Trading symbol
+
+        Returns:
+            Latest Trade or None if no trades received
+        """
+        trades = self._trades.get(symbol)
+        return trades[-1] if trades else None
 
     def get_best_bid(self, symbol: str) -> int | None:
         """
@@ -384,54 +489,173 @@ class MarketDataManager:
         """
         Add a callback for orderbook updates.
 
-        Callback signature: async def callback(symbol: str, orderbook: OrderBook)
+        Callback signature: [async] def callback(symbol: str, orderbook: OrderBook)
+
+        Updates that arrive within the same event loop pass are coalesced:
+        callbacks run once per symbol per pass, with the latest book. Async
+        callbacks are scheduled as tasks; plain functions are called directly
+        and should return quickly.
 
         Args:
-            callback: Async callback function
+            callback: Async or sync callback function
         """
-        self._orderbook_callbacks.append(callback)
+        if inspect.iscoroutinefunction(callback):
+            self._orderbook_callbacks += (callback,)
+        else:
+            self._orderbook_sync_callbacks += (callback,)
 
     def add_trade_callback(self, callback: Callable) -> None:
         """
         Add a callback for trade updates.
 
-        Callback signature: async def callback(symbol: str, trades: list[Trade])
+        Callback signature: [async] def callback(symbol: str, trades: list[Trade])
+
+        Async callbacks are scheduled as tasks; plain functions are called
+        inline on the message path and should return quickly.
+
+        Args:
+            callback: Async or sync callback function
+        """
+        if inspect.iscoroutinefunction(callback):
+            self._trade_callbacks += (callback,)
+        else:
+            self._trade_sync_callbacks += (callback,)
+
+    def add_tick_callback(self, callback: Callable) -> None:
+        """
+        Add a callback for combined orderbook and trade updates.
+
+        Callback signature: [async] def callback(tick: MarketTick)
+
+        Orderbook and trade messages for a symbol that arrive within the same
+        event loop pass are delivered as one MarketTick, so a consumer of both
+        is woken once instead of per message type. Async callbacks are
+        scheduled as tasks; plain functions are called directly and should
+        return quickly.
 
         Args:
-            callback: Async callback function
+            callback: Async or sync callback function
         """
-        self._trade_callbacks.append(callback)
+        if inspect.iscoroutinefunction(callback):
+            self._tick_callbacks += (callback,)
+        else:
+            self._tick_sync_callbacks += (callback,)
 
     async def _notify_orderbook_callbacks(
         self, symbol: str, orderbook: OrderBook
     ) -> None:
-        """Notify all orderbook callbacks."""
-        for callback in self._orderbook_callbacks:
+        """Schedule one orderbook callback fanout per symbol per loop pass."""
+        if self._tick_callbacks or self._tick_sync_callbacks:
+            self._pending_tick(symbol).orderbook = orderbook
+        if symbol in self._ob_notify_pending:
+            return
+        self._ob_notify_pending.add(symbol)
+        asyncio.get_running_loop().call_soon(
+            self._run_orderbook_callbacks, symbol, orderbook
+        )
+
+    def _run_orderbook_callbacks(self, symbol: str, orderbook: OrderBook) -> None:
+        """Notify all orderbook callbacks with the book's current state."""
+        self._ob_notify_pending.discard(symbol)
+        if self._orderbooks.get(symbol) is not orderbook:
+            return  # unsubscribed since the fanout was scheduled
+
+        for callback in self._orderbook_sync_callbacks:
             try:
-                asyncio.create_task(callback(symbol, orderbook))
+                result = callback(symbol, orderbook)
+                if inspect.isawaitable(result):
+                    self._spawn_callback(result)
             except Exception as e:
                 logger.error(f"Error in orderbook callback: {e}")
 
+        for callback in self._orderbook_callbacks:
+            self._spawn_callback(callback(symbol, orderbook))
+
     async def _notify_trade_callbacks(self, symbol: str, trades: list[Trade]) -> None:
         """Notify all trade callbacks."""
-        for callback in self._trade_callbacks:
+        for callback in self._trade_sync_callbacks:
             try:
-                asyncio.create_task(callback(symbol, trades))
+                result = callback(symbol, trades)
+                if inspect.isawaitable(result):
+                    self._spawn_callback(result)
             except Exception as e:
                 logger.error(f"Error in trade callback: {e}")
 
+        for callback in self._trade_callbacks:
+            self._spawn_callback(callback(symbol, trades))
+
+    def _pending_tick(self, symbol: str) -> MarketTick:
+        """Get the tick collecting this pass's changes, scheduling its fanout."""
+        tick = self._pending_ticks.get(symbol)
+        if tick is None:
+            tick = self._pending_ticks[symbol] = MarketTick(symbol)
+            asyncio.get_running_loop().call_soon(self._run_tick_callbacks, symbol)
+        return tick
+
+    def _run_tick_callbacks(self, symbol: str) -> None:
+        """Notify all tick callbacks with the changes collected for a symbol."""
+        tick = self._pending_ticks.pop(symbol, None)
+        if tick is None:
+            return  # cleared since the fanout was scheduled
+        orderbook = tick.orderbook
+        if orderbook is not None and self._orderbooks.get(symbol) is not orderbook:
+            tick.orderbook = None  # unsubscribed since the book changed
+            if not tick.trades:
+                return
+
+        for callback in self._tick_sync_callbacks:
+            try:
+                result = callback(tick)
+                if inspect.isawaitable(result):
+                    self._spawn_callback(result)
+            except Exception as e:
+                logger.error(f"Error in tick callback: {e}")
+
+        for callback in self._tick_callbacks:
+            self._spawn_callback(callback(tick))
+
+    def _spawn_callback(self, awaitable) -> None:
+        """Run an async callback as a task, logging its error when it finishes."""
+        # Python 3.12+ can start a task eagerly, running a callback inline up
+        # to its first suspension; callbacks that never suspend then skip the
+        # scheduler. Checked inline so type checkers narrow the version.
+        if sys.version_info >= (3, 12) and inspect.iscoroutine(awaitable):
+            task = asyncio.Task(
+                awaitable, loop=asyncio.get_running_loop(), eager_start=True
+            )
+            if task.done():
+                self._callback_done(task)
+                return
+        else:
+            task = asyncio.ensure_future(awaitable)
+        self._callback_tasks.add(task)
+        task.add_done_callback(self._callback_done)
+
+    def _callback_done(self, task: asyncio.Task) -> None:
+        """Release a finished callback task and log any exception it raised."""
+        self._callback_tasks.discard(task)
+        if not task.cancelled():
+            error = task.exception()
+            if error is not None:
+                logger.error(f"Error in market data callback: {error}", exc_info=error)
+
     def get_subscribed_symbols(self) -> list[str]:
-        """Get list of all subscribed symbols."""
-        symbols = set()
-        symbols.update(self._orderbooks.keys())
-        symbols.update(self._trades.keys())
-        return list(symbols)
+        """Get list of all subscribed symbols, in subscription order."""
+        return list(dict.fromkeys((*self._orderbooks, *self._trades)))
 
     async def cleanup(self) -> None:
         """Clean up resources."""
         async with self._lock:
             self._orderbooks.clear()
             self._trades.clear()
-            self._orderbook_callbacks.clear()
-            self._trade_callbacks.clear()
+            self._ob_channels.clear()
+            self._ob_notify_pending.clear()
+            self._pending_ticks.clear()
+            self._resync_attempts.clear()
+            self._orderbook_callbacks = ()
+            self._trade_callbacks = ()
+            self._orderbook_sync_callbacks = ()
+            self._trade_sync_callbacks = ()
+            self._tick_callbacks = ()
+            self._tick_sync_callbacks = ()
         logger.info("Market data manager cleaned up")
@@ -2,11 +2,107 @@
 
 from abc import ABC, abstractmethod
 
-from ..models.order import Order
+from ..models.order import Order, OrderStatus
 from ..models.product import Product
+from ..utils.config import Config
 from ..utils.integer_conversion import IntegerConverter
 from ..utils.logger import logger
 
+# Statuses of orders that are still working on the exchange
+_OPEN_STATES = frozenset({"open", "pending", "partially_filled"})
+
+# Statuses after which an order can no longer change
+_CLOSED_STATES = frozenset({"filled", "cancelled", "rejected"})
+
+
+class _OrderStore(dict[str, Order]):
+    """
+    Order cache keyed by client order ID, split into open and closed tiers.
+
+    Open orders are indexed (overall and per symbol) so they can be listed
+    without scanning history. Closed orders are kept in arrival order and the
+    oldest are evicted once more than max_closed are held, bounding memory
+    over a long session.
+
+    Any status outside _CLOSED_STATES counts as open, so statuses added later
+    never fall out of both tiers. Orders are indexed when stored and
+    re-indexed through reindex() on status changes. open_orders() re-checks
+    each status, so entries made stale by a direct status assignment are
+    dropped lazily.
+    """
+
+    def __init__(self, max_closed: int = Config.ORDER_HISTORY_SIZE) -> None:
+        super().__init__()
+        self._open: dict[str, Order] = {}
+        self._open_by_symbol: dict[str, dict[str, Order]] = {}
+        self._closed: dict[str, None] = {}  # insertion-ordered closed IDs
+        self._max_closed = max_closed
+
+    def __setitem__(self, client_order_id: str, order: Order) -> None:
+        super().__setitem__(client_order_id, order)
+        self.reindex(client_order_id, order)
+
+    def __delitem__(self, client_order_id: str) -> None:
+        order = self[client_order_id]
+        super().__delitem__(client_order_id)
+        self._discard(client_order_id, order.symbol)
+        self._closed.pop(client_order_id, None)
+
+    def reindex(self, client_order_id: str, order: Order) -> None:
+        """Move an order between the open and closed tiers based on its status."""
+        if order.status not in _CLOSED_STATES:
+            self._open[client_order_id] = order
+            self._open_by_symbol.setdefault(order.symbol, {})[client_order_id] = order
+            self._closed.pop(client_order_id, None)
+            return
+
+        self._discard(client_order_id, order.symbol)
+        self._archive(client_order_id)
+
+    def open_orders(self, symbol: str | None = None) -> list[Order]:
+        """
+        Get open orders without scanning closed ones.
+
+        Args:
+            symbol: Optional symbol to filter by
+
+        Returns:
+            List of open orders in insertion order
+        """
+        index = self._open if symbol is None else self._open_by_symbol.get(symbol)
+        if not index:
+            return []
+
+        orders = []
+        stale = []
+        for client_order_id, order in index.items():
+            if order.status not in _CLOSED_STATES:
+                orders.append(order)
+            else:
+                stale.append((client_order_id, order))
+        for client_order_id, order in stale:
+            self.reindex(client_order_id, order)
+        return orders
+
+    def open_count(self) -> int:
+        """Number of indexed open orders (may include not yet dropped stale ones)."""
+        return len(self._open)
+
+    def _archive(self, client_order_id: str) -> None:
+        closed = self._closed
+        closed.pop(client_order_id, None)
+        closed[client_order_id] = None
+        while len(closed) > self._max_closed:
+            oldest = next(iter(closed))
+            del closed[oldest]
+            super().pop(oldest, None)
+
+    def _discard(self, client_order_id: str, symbol: str) -> None:
+        self._open.pop(client_order_id, None)
+        by_symbol = self._open_by_symbol.get(symbol)
+        if by_symbol is not None:
+            by_symbol.pop(client_order_id, None)
+
 
 class OrderManager(ABC):
     """Abstract base class for order management."""
@@ -19,8 +115,22 @@ class OrderManager(ABC):
             converter: Integer converter instance
         """
         self.converter = converter
-        self._orders: dict[str, Order] = {}
+        self._orders = _OrderStore()
         self._product_map: dict[str, int] = {}  # symbol -> product_id
+        self._symbol_map: dict[int, str] = {}  # product_id -> symbol
+
+    def _set_status(self, order: Order, status: OrderStatus) -> None:
+        """
+        Update an order's status and keep the open-order index in sync.
+
+        Args:
+            order: Order to update
+            status: New status
+        """
+        order.status = status
+        client_order_id = order.client_order_id
+        if client_order_id and self._orders.get(client_order_id) is order:
+            self._orders.reindex(client_order_id, order)
 
     def register_product(self, product: Product) -> None:
         """
@@ -30,6 +140,7 @@ class OrderManager(ABC):
             product: Product to register
         """
         self._product_map[product.symbol] = product.product_id
+        self._symbol_map[product.product_id] = product.symbol
         logger.info(f"Registered product: {product.symbol} (ID: {product.product_id})")
 
     def get_product_id(self, symbol: str) -> int | None:
@@ -44,6 +155,18 @@ class OrderManager(ABC):
         """
         return self._product_map.get(symbol)
 
+    def get_symbol(self, product_id: int) -> str | None:
+        """
+        Get symbol for a product ID.
+
+        Args:
+            product_id: Product ID
+
+        Returns:
+            Symbol or None
+        """
+        return self._symbol_map.get(product_id)
+
     @abstractmethod
     async def place_order(self, order: Order) -> Order:
         """
@@ -155,8 +278,8 @@ class OrderManager(ABC):
         try:
             # Get all open orders from exchange
             exchange_orders = await self.get_open_orders()
-            exchange_order_ids = {
-                order.client_order_id
+            exchange_by_id = {
+                order.client_order_id: order
                 for order in exchange_orders
                 if order.client_order_id
             }
@@ -164,28 +287,23 @@ class OrderManager(ABC):
             # Update local orders
             for client_order_id, local_order in list(self._orders.items()):
                 # Skip already closed orders
-                if local_order.status in ["filled", "cancelled", "rejected"]:
+                if local_order.status in _CLOSED_STATES:
                     continue
 
-                if client_order_id in exchange_order_ids:
-                    # Order exists on exchange - update it
-                    exchange_order = next(
-                        o
-                        for o in exchange_orders
-                        if o.client_order_id == client_order_id
-                    )
-                    # Update local order with exchange state
-                    local_order.status = exchange_order.status
+                exchange_order = exchange_by_id.get(client_order_id)
+                if exchange_order is not None:
+                    # Order exists on exchange - update local order with its state
+                    self._set_status(local_order, exchange_order.status)
                     local_order.filled_size = exchange_order.filled_size
                     local_order.average_fill_price = exchange_order.average_fill_price
                     stats["synced"] += 1
                 else:
                     # Order doesn't exist on exchange - it was filled or cancelled
                     if local_order.filled_size >= local_order.size:
-                        local_order.status = "filled"
+                        self._set_status(local_order, "filled")
                         stats["filled"] += 1
                     else:
-                        local_order.status = "cancelled"
+                        self._set_status(local_order, "cancelled")
                         stats["cancelled"] += 1
 
                     logger.info(
@@ -1,28 +1,53 @@
+"""
+Paper trading order manager.
+
+Simulated latency, market order fills and the reconciliation loop all run on
+event loop timers. Call deltatrader.configure_loop() before asyncio.run() to
+use uvloop's faster timers and scheduling when the speedups extra is installed.
+"""
+
 import asyncio
-import uuid
+import heapq
+import secrets
+from itertools import count
 
 from ..models.order import Order
 from ..utils.integer_conversion import IntegerConverter
 from ..utils.logger import logger
 from ..utils.timing import get_timestamp_us
-from .order_manager import OrderManager
+from .order_manager import _OPEN_STATES, OrderManager
+
+_FILL_DELAY = 0.1  # seconds before a paper market order fills
 
 
 class PaperOrderManager(OrderManager):
     """Paper trading order manager (simulated orders)."""
 
-    def __init__(self, converter: IntegerConverter):
+    def __init__(self, converter: IntegerConverter, simulated_latency: float = 0.0):
         """
         Initialize PaperOrderManager.
 
         Args:
             converter: Integer converter instance
+            simulated_latency: Delay in seconds applied to place, cancel and
+                edit calls (0 disables it, e.g. for backtests)
         """
         super().__init__(converter)
         self._order_counter = 0
-        self._simulated_latency = 0.05  # 50ms simulated latency
+        # Per-instance prefix keeps client IDs unique across restarts
+        self._id_prefix = secrets.token_hex(4)
+        self._simulated_latency = 0.0
+        if simulated_latency:
+            self.set_simulated_latency(simulated_latency)
         self._reconciliation_task: asyncio.Task | None = None
         self._reconciliation_interval = 30  # seconds
+        # Pending market order fills as a (due loop time, seq, order) heap,
+        # drained by one loop timer armed for the earliest entry
+        self._pending_fills: list[tuple[float, int, Order]] = []
+        self._fill_seq = count()
+        self._fill_timer: asyncio.TimerHandle | None = None
+        # Wakes the reconciliation loop early (on request or stop)
+        self._reconciliation_wakeup = asyncio.Event()
         self._running = False
 
     async def place_order(self, order: Order) -> Order:
@@ -36,29 +61,36 @@ class PaperOrderManager(OrderManager):
             Updated order with ID and status
         """
         # Simulate network latency
-        await asyncio.sleep(self._simulated_latency)
+        if self._simulated_latency:
+            await asyncio.sleep(self._simulated_latency)
 
         # Generate order ID
         self._order_counter += 1
         order.exchange_order_id = self._order_counter
         if not order.client_order_id:
-            # Use UUID hex (32 chars) for consistency with live orders
-            order.client_order_id = uuid.uuid4().hex
+            # 32 hex chars like live IDs, without a urandom read per order
+            order.client_order_id = f"{self._id_prefix}{self._order_counter:024x}"
 
         # Set status to open (paper orders are instantly accepted)
         order.status = "open"
         order.timestamp = get_timestamp_us()
 
-        # Store order
+        # Store order (indexes it as open)
         self._orders[order.client_order_id] = order
 
+        # Lazy %-style args: nothing is formatted when INFO is filtered out
         logger.info(
-            f"[PAPER] Order placed: {order.symbol} {order.side} {order.size} @ {order.price} - ClientOrderID: {order.client_order_id}"
+            "[PAPER] Order placed: %s %s %s @ %s - ClientOrderID: %s",
+            order.symbol,
+            order.side,
+            order.size,
+            order.price,
+            order.client_order_id,
         )
 
         # Simulate immediate fill for market orders
         if order.order_type == "market_order":
-            asyncio.create_task(self._simulate_fill(order))
+            self._schedule_fill(order)
 
         return order
 
@@ -73,16 +105,17 @@ class PaperOrderManager(OrderManager):
             True if successful
         """
         # Simulate network latency
-        await asyncio.sleep(self._simulated_latency)
-
-        if client_order_id in self._orders:
-            order = self._orders[client_order_id]
-            if order.status in ["open", "pending"]:
-                order.status = "cancelled"
-                logger.info(f"[PAPER] Order cancelled: {client_order_id}")
+        if self._simulated_latency:
+            await asyncio.sleep(self._simulated_latency)
+
+        order = self._orders.get(client_order_id)
+        if order is not None:
+            if order.status in _OPEN_STATES:
+                self._set_status(order, "cancelled")
+                logger.info("[PAPER] Order cancelled: %s", client_order_id)
                 return True
 
-        logger.warning(f"[PAPER] Order not found or already closed: {client_order_id}")
+        logger.warning("[PAPER] Order not found or already closed: %s", client_order_id)
         return False
 
     async def cancel_all_orders(self, symbol: str | None = None) -> int:
@@ -96,16 +129,17 @@ class PaperOrderManager(OrderManager):
             Number of orders cancelled
         """
         # Simulate network latency
-        await asyncio.sleep(self._simulated_latency)
+        if self._simulated_latency:
+            await asyncio.sleep(self._simulated_latency)
 
         count = 0
-        for order in self._orders.values():
-            if symbol is None or order.symbol == symbol:
-                if order.status in ["open", "pending"]:
-                    order.status = "cancelled"
-                    count += 1
+        for order in self._orders.open_orders(symbol):
+            self._set_status(order, "cancelled")
+            count += 1
 
-        logger.info(f"[PAPER] Cancelled {count} orders for {symbol or 'all symbols'}")
+        logger.info(
+            "[PAPER] Cancelled %d orders for %s", count, symbol or "all symbols"
+        )
         return count
 
     async def get_open_orders(self, symbol: str | None = None) -> list[Order]:
@@ -118,30 +152,53 @@ class PaperOrderManager(OrderManager):
         Returns:
             List of open orders
         """
-        orders = []
-        for order in self._orders.values():
-            if order.status in ["open", "pending"]:
-                if symbol is None or order.symbol == symbol:
-                    orders.append(order)
-        return orders
-
-    async def _simulate_fill(self, order: Order, delay: float = 0.1) -> None:
+        return self._orders.open_orders(symbol)
+
+    def _schedule_fill(self, order: Order, delay: float = _FILL_DELAY) -> None:
         """
-        Simulate order fill after a delay.
+        Queue a simulated fill for an order after a delay.
 
         Args:
             order: Order to fill
             delay: Delay before fill in seconds
         """
-        await asyncio.sleep(delay)
-
+        loop = asyncio.get_running_loop()
+        due = loop.time() + delay
+        heapq.heappush(self._pending_fills, (due, next(self._fill_seq), order))
+
+        timer = self._fill_timer
+        if timer is None or due < timer.when():
+            if timer is not None:
+                timer.cancel()
+            self._fill_timer = loop.call_at(due, self._run_due_fills)
+
+    def _run_due_fills(self) -> None:
+        """Fill every queued order that is due, then re-arm the timer."""
+        self._fill_timer = None
+        pending = self._pending_fills
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        while pending and pending[0][0] <= now:
+            _, _, order = heapq.heappop(pending)
+            self._fill_order(order)
+
+        if pending:
+            self._fill_timer = loop.call_at(pending[0][0], self._run_due_fills)
+
+    def _fill_order(self, order: Order) -> None:
+        """Fill an order at its own price if it is still open."""
         if order.status == "open":
-            order.status = "filled"
             order.filled_size = order.size
             order.average_fill_price = order.price
+            self._set_status(order, "filled")
 
             logger.info(
-                f"[PAPER] Order filled: {order.client_order_id} - {order.symbol} {order.side} {order.size} @ {order.price}"
+                "[PAPER] Order filled: %s - %s %s %s @ %s",
+                order.client_order_id,
+                order.symbol,
+                order.side,
+                order.size,
+                order.price,
             )
 
     def simulate_fill(self, order_id: str, fill_price: int | None = None) -> bool:
@@ -155,15 +212,20 @@ class PaperOrderManager(OrderManager):
         Returns:
             True if successful
         """
-        if order_id in self._orders:
-            order = self._orders[order_id]
+        order = self._orders.get(order_id)
+        if order is not None:
             if order.status == "open":
-                order.status = "filled"
                 order.filled_size = order.size
                 order.average_fill_price = fill_price or order.price
+                self._set_status(order, "filled")
 
                 logger.info(
-                    f"[PAPER] Manual fill: {order_id} - {order.symbol} {order.side} {order.size} @ {order.average_fill_price}"
+                    "[PAPER] Manual fill: %s - %s %s %s @ %s",
+                    order_id,
+                    order.symbol,
+                    order.side,
+                    order.size,
+                    order.average_fill_price,
                 )
                 return True
 
@@ -190,18 +252,21 @@ class PaperOrderManager(OrderManager):
             Updated order if successful, None otherwise
         """
         # Simulate network latency
-        await asyncio.sleep(self._simulated_latency)
+        if self._simulated_latency:
+            await asyncio.sleep(self._simulated_latency)
 
         # Get the existing order
         order = self.get_order(client_order_id)
         if not order:
-            logger.error(f"[PAPER] Order not found for edit: {client_order_id}")
+            logger.error("[PAPER] Order not found for edit: %s", client_order_id)
             return None
 
         # Check if order is still open
-        if order.status not in ["open", "pending"]:
+        if order.status not in _OPEN_STATES:
             logger.error(
-                f"[PAPER] Cannot edit order {client_order_id}: status is {order.status}"
+                "[PAPER] Cannot edit order %s: status is %s",
+                client_order_id,
+                order.status,
             )
             return None
 
@@ -212,13 +277,17 @@ class PaperOrderManager(OrderManager):
         # Check if anything actually changed
         if size == order.size and price == order.price:
             logger.info(
-                f"[PAPER] No changes for order {client_order_id}, skipping edit"
+                "[PAPER] No changes for order %s, skipping edit", client_order_id
             )
             return order
 
         logger.info(
-            f"[PAPER] Editing order {client_order_id}: "
-            f"size {order.size}->{size}, price {order.price}->{price}"
+            "[PAPER] Editing order %s: size %s->%s, price %s->%s",
+            client_order_id,
+            order.size,
+            size,
+            order.price,
+            price,
         )
 
         # Update order in place (paper trading advantage - instant edit)
@@ -226,7 +295,7 @@ class PaperOrderManager(OrderManager):
         order.price = price
         order.timestamp = get_timestamp_us()
 
-        logger.info(f"[PAPER] Order edited successfully: {client_order_id}")
+        logger.info("[PAPER] Order edited successfully: %s", client_order_id)
         return order
 
     async def start_reconciliation(self) -> None:
@@ -236,9 +305,11 @@ class PaperOrderManager(OrderManager):
             return
 
         self._running = True
+        self._reconciliation_wakeup.clear()
         self._reconciliation_task = asyncio.create_task(self._reconciliation_loop())
         logger.info(
-            f"[PAPER] Started order reconciliation (interval: {self._reconciliation_interval}s)"
+            "[PAPER] Started order reconciliation (interval: %ss)",
+            self._reconciliation_interval,
         )
 
     async def stop_reconciliation(self) -> None:
@@ -248,9 +319,10 @@ class PaperOrderManager(OrderManager):
 
         logger.info("[PAPER] Stopping order reconciliation...")
         self._running = False
+        self._reconciliation_wakeup.set()
 
+        # The loop wakes immediately and exits; paper passes never block
         if self._reconciliation_task:
-            self._reconciliation_task.cancel()
             try:
                 await self._reconciliation_task
             except asyncio.CancelledError:
@@ -262,19 +334,48 @@ class PaperOrderManager(OrderManager):
         """Periodic reconciliation loop."""
         try:
             while self._running:
-                await asyncio.sleep(self._reconciliation_interval)
+                # Wait for the interval, waking early on request or stop
+                try:
+                    await asyncio.wait_for(
+                        self._reconciliation_wakeup.wait(),
+                        self._reconciliation_interval,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._reconciliation_wakeup.clear()
+                if not self._running:
+                    break
 
                 try:
                     stats = await self.reconcile_orders()
-                    logger.debug(f"[PAPER] Reconciliation stats: {stats}")
+                    logger.debug("[PAPER] Reconciliation stats: %s", stats)
                 except Exception as e:
                     logger.error(
-                        f"[PAPER] Error in reconciliation loop: {e}", exc_info=True
+                        "[PAPER] Error in reconciliation loop: %s", e, exc_info=True
                     )
 
         except asyncio.CancelledError:
             logger.debug("[PAPER] Reconciliation loop cancelled")
 
+    def set_simulated_latency(self, latency: float) -> None:
+        """
+        Set the simulated network latency.
+
+        Args:
+            latency: Delay in seconds applied to place, cancel and edit calls
+                (0 disables it)
+        """
+        if latency < 0:
+            logger.warning("[PAPER] Simulated latency cannot be negative")
+            latency = 0.0
+
+        self._simulated_latency = latency
+        logger.info("[PAPER] Simulated latency set to %ss", latency)
+
+    def request_reconciliation(self) -> None:
+        """Run the next reconciliation pass now instead of at the interval."""
+        self._reconciliation_wakeup.set()
+
     def set_reconciliation_interval(self, interval: int) -> None:
         """
         Set the reconciliation interval.
@@ -287,4 +388,4 @@ class PaperOrderManager(OrderManager):
             interval = 5
 
         self._reconciliation_interval = interval
-        logger.info(f"[PAPER] Reconciliation interval set to {interval}s")
+        logger.info("[PAPER] Reconciliation interval set to %ss", interval)
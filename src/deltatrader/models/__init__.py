@@ -3,9 +3,11 @@
 from .order import Order, OrderSide, OrderStatus, OrderType
 from .orderbook import OrderBook
 from .product import Product
+from .tick import MarketTick
 from .trade import Trade
 
 __all__ = [
+    "MarketTick",
     "Order",
     "OrderSide",
     "OrderStatus",
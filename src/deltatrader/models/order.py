@@ -1,10 +1,10 @@
 """Order model."""
 
+import sys
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Literal
+from typing import Final, Literal
 
-from ..utils.timing import get_timestamp_us
+from ..utils.timing import get_timestamp_us, parse_delta_iso_us
 
 OrderSide = Literal["buy", "sell"]
 OrderType = Literal["limit_order", "market_order"]
@@ -12,8 +12,18 @@ OrderStatus = Literal[
     "pending", "open", "partially_filled", "filled", "cancelled", "rejected"
 ]
 
+# Exchange order state -> internal status
+_STATUS_MAP: Final[dict[str, OrderStatus]] = {
+    "open": "open",
+    "pending": "pending",
+    "partially_filled": "partially_filled",
+    "closed": "filled",
+    "cancelled": "cancelled",
+    "rejected": "rejected",
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class Order:
     """Represents an order."""
 
@@ -32,6 +42,15 @@ class Order:
     average_fill_price: int | None = None
     timestamp: int = field(default_factory=get_timestamp_us)
 
+    # Running sum of fill_price * fill_size and the filled size it covers
+    _notional: int = field(default=0, init=False, repr=False, compare=False)
+    _notional_size: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Last raw WebSocket value and its converted integer, per field
+    _raw_cache: dict[str, tuple[object, int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
     def to_api_payload(self, converter, product_id: int) -> dict:
         """Convert to Delta Exchange API payload."""
         payload = {
@@ -52,17 +71,16 @@ class Order:
     @classmethod
     def from_api(cls, data: dict, converter) -> "Order":
         """Create Order from API response."""
-        symbol = data.get("product", {}).get("symbol", "")
+        # Symbols repeat across every order; share one string per symbol
+        symbol = sys.intern(data.get("product", {}).get("symbol", ""))
         price_str = data.get("limit_price")
 
         # Parse timestamp - API returns ISO format string like '2026-02-07T12:22:51.882176Z'
         created_at = data.get("created_at")
         if created_at and isinstance(created_at, str):
             try:
-                # Parse ISO format and convert to microseconds
-                dt = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-                timestamp = int(dt.timestamp() * 1_000_000)
-            except (ValueError, AttributeError):
+                timestamp = parse_delta_iso_us(created_at)
+            except ValueError:
                 timestamp = get_timestamp_us()
         else:
             timestamp = (
@@ -73,13 +91,13 @@ class Order:
             symbol=symbol,
             side=data["side"],
             order_type=data["order_type"],
-            size=converter.size_to_integer(str(data["unfilled_size"])),
+            size=converter.size_to_integer(data["unfilled_size"]),
             price=converter.price_to_integer(symbol, price_str) if price_str else None,
             client_order_id=data.get("client_order_id"),
             exchange_order_id=int(data["id"]),
-            status=cls._map_status(data.get("state", "open")),
-            filled_size=converter.size_to_integer(str(data.get("size", 0)))
-            - converter.size_to_integer(str(data.get("unfilled_size", 0))),
+            status=_STATUS_MAP.get(data.get("state", "open"), "pending"),
+            filled_size=converter.size_to_integer(data.get("size", 0))
+            - converter.size_to_integer(data.get("unfilled_size", 0)),
             average_fill_price=converter.price_to_integer(
                 symbol, str(data["average_fill_price"])
             )
@@ -89,19 +107,6 @@ class Order:
             product_id=data["product"]["id"],
         )
 
-    @staticmethod
-    def _map_status(api_status: str) -> OrderStatus:
-        """Map API status to internal status."""
-        status_map: dict[str, OrderStatus] = {
-            "open": "open",
-            "pending": "pending",
-            "partially_filled": "partially_filled",
-            "closed": "filled",
-            "cancelled": "cancelled",
-            "rejected": "rejected",
-        }
-        return status_map.get(api_status, "pending")
-
     def __repr__(self) -> str:
         return (
             f"Order("
@@ -1,10 +1,27 @@
 """Orderbook model with integer values."""
 
 import zlib
+from bisect import bisect_left
 from dataclasses import dataclass, field
+from operator import itemgetter
 
+# Sort keys for binary search over levels: asks ascend by price, bids descend
+_price = itemgetter(0)
 
-@dataclass
+
+def _neg_price(level: tuple[int, int]) -> int:
+    return -level[0]
+
+
+def _raw_price(level: tuple[str, str]) -> float:
+    return float(level[0])
+
+
+def _neg_raw_price(level: tuple[str, str]) -> float:
+    return -float(level[0])
+
+
+@dataclass(slots=True)
 class OrderBook:
     """Level 2 order book with integer prices and sizes."""
 
@@ -22,6 +39,8 @@ class OrderBook:
     _raw_asks: list[tuple[str, str]] = field(
         default_factory=list
     )  # [(price_str, size_str), ...]
+    # Whether the last apply_update changed the top levels of either side
+    top_changed: bool = field(default=True, init=False, repr=False, compare=False)
 
     def update_from_snapshot(self, snapshot_data: dict, converter) -> None:
         """Update orderbook from l2_orderbook or l2_updates snapshot."""
@@ -34,57 +53,64 @@ class OrderBook:
         )
 
         # Convert bids - support both "buy" (l2_orderbook) and "bids" (l2_updates)
-        self.bids = []
-        self._raw_bids = []
         buy_levels = snapshot_data.get("buy") or snapshot_data.get("bids", [])
-        for level in buy_levels:
-            # l2_updates format: [price, size] array
-            # l2_orderbook format: {"limit_price": "...", "size": ...} object
-            if isinstance(level, list):
-                price_str = str(level[0])
-                size_str = str(level[1])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            else:
-                price_str = level["limit_price"]
-                size_str = str(level["size"])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            self.bids.append((price_int, size_int))
-            self._raw_bids.append((price_str, size_str))
+        self.bids, self._raw_bids = self._parse_snapshot_side(
+            buy_levels, converter, reverse=True
+        )
 
         # Convert asks - support both "sell" (l2_orderbook) and "asks" (l2_updates)
-        self.asks = []
-        self._raw_asks = []
         sell_levels = snapshot_data.get("sell") or snapshot_data.get("asks", [])
-        for level in sell_levels:
+        self.asks, self._raw_asks = self._parse_snapshot_side(
+            sell_levels, converter, reverse=False
+        )
+
+    def _parse_snapshot_side(
+        self, levels: list, converter, reverse: bool
+    ) -> tuple[list[tuple[int, int]], list[tuple[str, str]]]:
+        """
+        Convert one side of a snapshot into sorted integer and raw levels.
+
+        Integer and raw levels are sorted together on the integer price, so
+        the raw strings never need to be re-parsed as floats for ordering.
+        """
+        price_to_integer = converter.price_encoder(self.symbol)
+        size_to_integer = converter.size_to_integer
+
+        rows: list[tuple[int, int, str, str]] = []
+        append = rows.append
+        for level in levels:
             # l2_updates format: [price, size] array
             # l2_orderbook format: {"limit_price": "...", "size": ...} object
             if isinstance(level, list):
                 price_str = str(level[0])
                 size_str = str(level[1])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
             else:
-                price_str = level["limit_price"]
+                price_str = str(level["limit_price"])
                 size_str = str(level["size"])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            self.asks.append((price_int, size_int))
-            self._raw_asks.append((price_str, size_str))
-
-        # Sort: bids descending, asks ascending
-        self.bids.sort(reverse=True, key=lambda x: x[0])
-        self.asks.sort(key=lambda x: x[0])
-
-        # Sort raw values to match
-        self._raw_bids.sort(reverse=True, key=lambda x: float(x[0]))
-        self._raw_asks.sort(key=lambda x: float(x[0]))
+            append(
+                (
+                    price_to_integer(price_str),
+                    size_to_integer(size_str),
+                    price_str,
+                    size_str,
+                )
+            )
+
+        # Bids descending, asks ascending
+        rows.sort(key=_price, reverse=reverse)
+        return (
+            [(price, size) for price, size, _, _ in rows],
+            [(price_str, size_str) for _, _, price_str, size_str in rows],
+        )
 
-    def apply_update(self, update_data: dict, converter) -> bool:
+    def apply_update(self, update_data: dict, converter, top_levels: int = 0) -> bool:
         """
         Apply incremental l2_updates.
         Returns True if successful, False if sequence mismatch.
+
+        With top_levels > 0, top_changed records whether the update changed
+        any of the first top_levels levels on either side; otherwise it is
+        always True.
         """
         # Support both sequence_no and last_sequence_no field names
         new_seq = int(
@@ -98,63 +124,64 @@ class OrderBook:
         self.sequence_no = new_seq
         self.timestamp = int(update_data.get("timestamp", 0))
 
-        # Apply buy updates - support both "buy" (l2_orderbook) and "bids" (l2_updates)
-        buy_updates = update_data.get("buy") or update_data.get("bids", [])
-        for level in buy_updates:
-            # l2_updates format: [price, size] array
-            # l2_orderbook format: {"limit_price": "...", "size": ...} object
-            if isinstance(level, list):
-                price_str = str(level[0])
-                size_str = str(level[1])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            else:
-                price_str = level["limit_price"]
-                size_str = str(level["size"])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            self._update_level(self.bids, price_int, size_int, reverse=True)
-            self._update_raw_level(self._raw_bids, price_str, size_str, reverse=True)
-
-        # Apply sell updates - support both "sell" (l2_orderbook) and "asks" (l2_updates)
-        sell_updates = update_data.get("sell") or update_data.get("asks", [])
-        for level in sell_updates:
-            # l2_updates format: [price, size] array
-            # l2_orderbook format: {"limit_price": "...", "size": ...} object
-            if isinstance(level, list):
-                price_str = str(level[0])
-                size_str = str(level[1])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            else:
-                price_str = level["limit_price"]
-                size_str = str(level["size"])
-                price_int = converter.price_to_integer(self.symbol, price_str)
-                size_int = converter.size_to_integer(size_str)
-            self._update_level(self.asks, price_int, size_int, reverse=False)
-            self._update_raw_level(self._raw_asks, price_str, size_str, reverse=False)
+        # Levels are updated in place, so copy the top before applying
+        if top_levels > 0:
+            top_before = (self.bids[:top_levels], self.asks[:top_levels])
+
+        # Bind per-update lookups once; this runs on every WebSocket tick
+        encode_price = converter.price_encoder(self.symbol)
+        size_to_integer = converter.size_to_integer
+        update_level = self._update_level
+        update_raw_level = self._update_raw_level
 
+        # Support both "buy"/"sell" (l2_orderbook) and "bids"/"asks" (l2_updates)
+        sides = (
+            (update_data.get("buy") or update_data.get("bids", []), True),
+            (update_data.get("sell") or update_data.get("asks", []), False),
+        )
+        for updates, reverse in sides:
+            levels, raw_levels = (
+                (self.bids, self._raw_bids) if reverse else (self.asks, self._raw_asks)
+            )
+            for level in updates:
+                # l2_updates format: [price, size] array
+                # l2_orderbook format: {"limit_price": "...", "size": ...} object
+                if isinstance(level, list):
+                    price_str = str(level[0])
+                    size_str = str(level[1])
+                else:
+                    price_str = str(level["limit_price"])
+                    size_str = str(level["size"])
+                update_level(
+                    levels, encode_price(price_str), size_to_integer(size_str), reverse
+                )
+                update_raw_level(raw_levels, price_str, size_str, reverse)
+
+        self.top_changed = top_levels <= 0 or top_before != (
+            self.bids[:top_levels],
+            self.asks[:top_levels],
+        )
         return True
 
     def _update_level(
         self, levels: list[tuple[int, int]], price: int, size: int, reverse: bool
     ) -> None:
-        """Update or remove a price level."""
-        # Find existing level
-        for i, (p, _) in enumerate(levels):
-            if p == price:
-                if size == 0:
-                    # Remove level
-                    levels.pop(i)
-                else:
-                    # Update size
-                    levels[i] = (price, size)
-                return
-
-        # Add new level if size > 0
-        if size > 0:
-            levels.append((price, size))
-            levels.sort(reverse=reverse, key=lambda x: x[0])
+        """Update or remove a price level (binary search on the sorted side)."""
+        if reverse:
+            i = bisect_left(levels, -price, key=_neg_price)
+        else:
+            i = bisect_left(levels, price, key=_price)
+
+        if i < len(levels) and levels[i][0] == price:
+            if size == 0:
+                # Remove level
+                del levels[i]
+            else:
+                # Update size
+                levels[i] = (price, size)
+        elif size > 0:
+            # Add new level in sorted position
+            levels.insert(i, (price, size))
 
     def _update_raw_level(
         self,
@@ -165,22 +192,21 @@ class OrderBook:
     ) -> None:
         """Update or remove a raw price level (string format)."""
         price_float = float(price_str)
-
-        # Find existing level
-        for i, (p, _) in enumerate(levels):
-            if float(p) == price_float:
-                if float(size_str) == 0:
-                    # Remove level
-                    levels.pop(i)
-                else:
-                    # Update size
-                    levels[i] = (price_str, size_str)
-                return
-
-        # Add new level if size > 0
-        if float(size_str) > 0:
-            levels.append((price_str, size_str))
-            levels.sort(reverse=reverse, key=lambda x: float(x[0]))
+        if reverse:
+            i = bisect_left(levels, -price_float, key=_neg_raw_price)
+        else:
+            i = bisect_left(levels, price_float, key=_raw_price)
+
+        if i < len(levels) and float(levels[i][0]) == price_float:
+            if float(size_str) == 0:
+                # Remove level
+                del levels[i]
+            else:
+                # Update size
+                levels[i] = (price_str, size_str)
+        elif float(size_str) > 0:
+            # Add new level in sorted position
+            levels.insert(i, (price_str, size_str))
 
     def validate_checksum(self, checksum: int, converter) -> bool:
         """
@@ -202,19 +228,18 @@ class OrderBook:
 
         Uses raw string values from the server to ensure exact formatting match.
         """
-        # Take top 10 bids and asks from raw values (already sorted)
-        top_raw_asks = self._raw_asks[:10]
-        top_raw_bids = self._raw_bids[:10]
-
-        # Build ask strings (already in ascending order)
-        ask_parts = [f"{price}:{size}" for price, size in top_raw_asks]
-
-        # Build bid strings (already in descending order)
-        bid_parts = [f"{price}:{size}" for price, size in top_raw_bids]
-
-        # Combine: asks,asks,asks|bids,bids,bids
-        checksum_string = ",".join(ask_parts) + "|" + ",".join(bid_parts)
-        return zlib.crc32(checksum_string.encode()) & 0xFFFFFFFF
+        # zlib.crc32 already returns an unsigned 32-bit value on Python 3
+        return zlib.crc32(self.checksum_string().encode())
+
+    def checksum_string(self) -> str:
+        """Build the checksum input string from the top 10 raw levels per side."""
+        # Raw levels are (price, size) string pairs, already sorted; joining
+        # them with map(":".join) keeps the formatting loop in C
+        return (
+            ",".join(map(":".join, self._raw_asks[:10]))
+            + "|"
+            + ",".join(map(":".join, self._raw_bids[:10]))
+        )
 
     def get_best_bid(self) -> tuple[int, int]:
         """Get best bid (highest price)."""
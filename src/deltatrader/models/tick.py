@@ -0,0 +1,15 @@
+"""Market tick model."""
+
+from dataclasses import dataclass, field
+
+from .orderbook import OrderBook
+from .trade import Trade
+
+
+@dataclass(slots=True)
+class MarketTick:
+    """Orderbook and trade changes for one symbol within one event loop pass."""
+
+    symbol: str
+    orderbook: OrderBook | None = None  # Latest book, None if it did not change
+    trades: list[Trade] = field(default_factory=list)  # New trades, oldest first
@@ -1,10 +1,13 @@
 """Trade model."""
 
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Literal
 
+from ..utils.logger import logger
 
-@dataclass
+
+@dataclass(slots=True)
 class Trade:
     """Represents a trade with integer values."""
 
@@ -18,15 +21,48 @@ class Trade:
     @classmethod
     def from_api(cls, symbol: str, data: dict, converter) -> "Trade":
         """Create Trade from API response."""
+        return cls._from_row(
+            symbol, data, converter.price_encoder(symbol), converter.size_to_integer
+        )
+
+    @classmethod
+    def from_api_many(
+        cls, symbol: str, trades_data: list[dict], converter
+    ) -> list["Trade"]:
+        """
+        Create Trades from a list of API trade entries.
+
+        Entries that fail to parse are logged and skipped.
+        """
+        encode_price = converter.price_encoder(symbol)
+        size_to_integer = converter.size_to_integer
+        from_row = cls._from_row
+        trades: list[Trade] = []
+        append = trades.append
+        for data in trades_data:
+            try:
+                append(from_row(symbol, data, encode_price, size_to_integer))
+            except Exception as e:
+                logger.warning(f"Failed to parse trade: {e}")
+        return trades
+
+    @classmethod
+    def _from_row(
+        cls,
+        symbol: str,
+        data: dict,
+        encode_price: Callable[[str], int],
+        size_to_integer: Callable[[str | int | float], int],
+    ) -> "Trade":
+        """Create one Trade with the symbol's converters already bound."""
         # Map buyer_role to side
-        buyer_role = data.get("buyer_role", "")
-        side = "buy" if buyer_role == "taker" else "sell"
+        side = "buy" if data.get("buyer_role") == "taker" else "sell"
 
         return cls(
             symbol=symbol,
             trade_id=str(data.get("id", data.get("trade_id", ""))),
-            price=converter.price_to_integer(symbol, str(data["price"])),
-            size=converter.size_to_integer(str(data["size"])),
+            price=encode_price(str(data["price"])),
+            size=size_to_integer(data["size"]),
             timestamp=int(data.get("timestamp", 0)),
             side=side,
         )
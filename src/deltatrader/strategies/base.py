@@ -6,6 +6,7 @@ from ..core.market_data import MarketDataManager
 from ..core.order_manager import OrderManager
 from ..models.order import Order
 from ..models.orderbook import OrderBook
+from ..models.tick import MarketTick
 from ..models.trade import Trade
 from ..utils.logger import logger
 
@@ -46,9 +47,8 @@ class Strategy(ABC):
         self._running = True
         logger.info(f"Strategy {self.name} started")
 
-        # Register callbacks
-        self.market_data.add_orderbook_callback(self._on_orderbook_update)
-        self.market_data.add_trade_callback(self._on_trade_update)
+        # Register one callback for both orderbook and trade updates
+        self.market_data.add_tick_callback(self._on_market_tick)
 
         # Call user initialization hook
         await self.on_start()
@@ -110,6 +110,15 @@ class Strategy(ABC):
         """
         pass
 
+    async def _on_market_tick(self, tick: MarketTick) -> None:
+        """Internal market tick handler, dispatching to the update hooks."""
+        if tick.symbol not in self.symbols:
+            return
+        if tick.orderbook is not None:
+            await self._on_orderbook_update(tick.symbol, tick.orderbook)
+        if tick.trades:
+            await self._on_trade_update(tick.symbol, tick.trades)
+
     async def _on_orderbook_update(self, symbol: str, orderbook: OrderBook) -> None:
         """Internal orderbook update handler."""
         if symbol in self.symbols:
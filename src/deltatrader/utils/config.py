@@ -30,6 +30,13 @@ class Config:
     # l2_updates: Initial snapshot + incremental updates (max 100 symbols per connection)
     ORDERBOOK_CHANNEL: str = os.getenv("ORDERBOOK_CHANNEL", "l2_orderbook")
 
+    # Opt-in: l2_updates that leave the top ORDERBOOK_NOTIFY_DEPTH levels per
+    # side unchanged skip callbacks and have their checksum validated only
+    # every CHECKSUM_SAMPLE_INTERVAL-th sequence number. 0 (default) notifies
+    # and validates every update; strategies reading deeper levels need that.
+    ORDERBOOK_NOTIFY_DEPTH = 0
+    CHECKSUM_SAMPLE_INTERVAL = 10
+
     # WebSocket URLs
     WS_PRODUCTION_URL = "wss://socket.india.delta.exchange"
     WS_TESTNET_URL = "wss://socket-ind.testnet.deltaex.org"
@@ -43,6 +50,16 @@ class Config:
     WS_RECONNECT_DELAY = 5  # seconds
     WS_MAX_RECONNECT_ATTEMPTS = 10
     REST_TIMEOUT = 10  # seconds
+    REST_POOL_SIZE = 100  # max pooled keep-alive connections
+    REST_DNS_CACHE_TTL = 300  # seconds
+    REST_KEEPALIVE_TIMEOUT = 60  # seconds an idle pooled connection is kept
+
+    # Order history
+    ORDER_HISTORY_SIZE = 10_000  # closed orders kept in memory
+
+    # Order batching
+    ORDER_BATCH_WINDOW = 0.003  # seconds to coalesce queued orders
+    ORDER_BATCH_MAX = 20  # max orders per batch request
 
     @classmethod
     def get_ws_url(cls) -> str:
@@ -0,0 +1,32 @@
+"""Event loop configuration."""
+
+import asyncio
+
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+from .logger import logger
+
+
+def configure_loop() -> bool:
+    """
+    Install uvloop as the asyncio event loop policy if it is available.
+
+    The policy only applies to loops created afterwards, so call this once at
+    startup before ``asyncio.run()`` (or any other loop/task creation).
+    Without uvloop the default asyncio loop is left in place.
+
+    Returns:
+        True if uvloop was installed, False otherwise
+    """
+    if not UVLOOP_AVAILABLE:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.info("Using uvloop event loop policy")
+    return True
@@ -1,17 +1,38 @@
 """Integer conversion utilities for precise decimal handling."""
 
+from collections.abc import Callable
 from decimal import Decimal
+from functools import lru_cache, partial
 
 from ..models.product import Product
 
+# Decimal places for power-of-ten scales, for formatting without Decimal
+_SCALE_DECIMALS = {10**n: n for n in range(19)}
+
+
+def _format_scaled(value: int, scale: int) -> str:
+    """Format value / scale as a plain decimal string, trailing zeros stripped."""
+    decimals = _SCALE_DECIMALS.get(scale)
+    if decimals is None:
+        return str(Decimal(value) / Decimal(scale))
+    whole, frac = divmod(abs(value), scale)
+    sign = "-" if value < 0 else ""
+    if not frac:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}.{frac:0{decimals}d}".rstrip("0")
+
 
 class IntegerConverter:
     """Converts decimal prices/sizes to integers and back."""
 
-    def __init__(self):
+    def __init__(self, price_cache_size: int = 4096):
         self._product_scales: dict[str, int] = {}
         self._product_tick_sizes: dict[str, int] = {}
 
+        # Orderbook levels repeat the same price strings constantly; memoize
+        # the Decimal conversion per (symbol, price). Cleared on scale changes.
+        self._price_cache = lru_cache(maxsize=price_cache_size)(self._price_to_integer)
+
     def register_product(self, product: Product) -> None:
         """Register a product for conversion."""
         # Calculate scale factor from tick_size
@@ -30,25 +51,40 @@ class IntegerConverter:
 
         # Store integer representation of tick_size
         self._product_tick_sizes[product.symbol] = int(temp)
+        self._price_cache.cache_clear()
 
     def get_scale(self, symbol: str) -> int:
         """Get scale factor for a symbol."""
         return self._product_scales.get(symbol, 100000000)  # Default 8 decimals
 
     def price_to_integer(self, symbol: str, price: str) -> int:
-        """Convert price string to integer."""
+        """Convert price string to integer (cached per symbol and price)."""
+        return self._price_cache(symbol, price)
+
+    def price_encoder(self, symbol: str) -> Callable[[str], int]:
+        """
+        Get a price_to_integer equivalent with the symbol bound in.
+
+        Calls go straight to the shared price cache, skipping the method
+        dispatch per call; meant for loops converting many levels of one
+        symbol. Stays valid across scale changes.
+        """
+        return partial(self._price_cache, symbol)
+
+    def _price_to_integer(self, symbol: str, price: str) -> int:
+        """Convert price string to integer without the cache."""
         scale = self.get_scale(symbol)
         decimal_price = Decimal(price)
         return int(decimal_price * scale)
 
-    def size_to_integer(self, size) -> int:
+    def size_to_integer(self, size: str | int | float) -> int:
         """Convert size string or int to integer (contracts are usually integers already)."""
         # Sizes in futures are typically integer contract counts
         # But some APIs send them as strings, others as ints
         if isinstance(size, int):
             return size
 
-        size_str = str(size)
+        size_str = size if isinstance(size, str) else str(size)
         if "." in size_str:
             # Handle decimal sizes if present
             decimal_size = Decimal(size_str)
@@ -57,18 +93,22 @@ class IntegerConverter:
 
     def integer_to_price(self, symbol: str, price_int: int) -> str:
         """Convert integer price back to decimal string."""
-        scale = self.get_scale(symbol)
-        decimal_price = Decimal(price_int) / Decimal(scale)
-        return str(decimal_price)
+        return _format_scaled(price_int, self.get_scale(symbol))
 
     def integer_to_size(self, size_int: int) -> str:
         """Convert integer size back to string."""
         # If we used 8 decimal precision for sizes
         if size_int > 1000000:
-            decimal_size = Decimal(size_int) / Decimal(100000000)
-            return str(decimal_size)
+            return _format_scaled(size_int, 100000000)
         return str(size_int)
 
+    def integer_to_contract_count(self, size_int: int) -> int:
+        """Convert integer size to a whole contract count for the API."""
+        # Mirrors integer_to_size: large values carry 8 decimal precision
+        if size_int > 1000000:
+            return size_int // 100000000
+        return size_int
+
     def normalize_price(self, symbol: str, price_int: int) -> int:
         """Normalize price to nearest valid tick."""
         tick_size = self._product_tick_sizes.get(symbol, 1)
@@ -89,3 +129,4 @@ class IntegerConverter:
         """Manually set scale for a symbol."""
         self._product_scales[symbol] = scale
         self._product_tick_sizes[symbol] = tick_size_int
+        self._price_cache.cache_clear()
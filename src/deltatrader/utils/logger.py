@@ -2,6 +2,7 @@
 
 import logging
 import sys
+import time
 from datetime import datetime
 
 from .config import Config
@@ -26,6 +27,38 @@ class MicrosecondFormatter(logging.Formatter):
         return s
 
 
+class LogRateLimiter:
+    """Token bucket that limits how often an expensive log call is emitted.
+
+    Example:
+        if limiter.try_acquire():
+            logger.error("...", exc_info=True)
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        """
+        Args:
+            rate: Tokens refilled per second
+            burst: Maximum tokens held (defaults to rate)
+        """
+        self._rate = rate
+        self._burst = float(burst if burst is not None else rate)
+        self._tokens = self._burst
+        self._last = time.monotonic()
+        self.suppressed = 0
+
+    def try_acquire(self) -> bool:
+        """Take a token if available, counting the call as suppressed if not."""
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.suppressed += 1
+        return False
+
+
 def setup_logger(name: str = "crypt") -> logging.Logger:
     """Set up and return a configured logger."""
     logger = logging.getLogger(name)
@@ -1,6 +1,36 @@
 """Timestamp utilities for microsecond precision."""
 
 import time
+from datetime import datetime
+
+try:
+    import ciso8601
+
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+# Days before the first of each month in a non-leap year
+_DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+# Days in each month in a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year: int) -> bool:
+    """Whether year is a Gregorian leap year."""
+    return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+
+
+def _days_since_epoch(year: int, month: int, day: int) -> int:
+    """Days from 1970-01-01 to a proleptic Gregorian date (year >= 1)."""
+    if not 1 <= month <= 12:
+        raise ValueError(f"month must be in 1..12, got {month}")
+    y = year - 1
+    days = y * 365 + y // 4 - y // 100 + y // 400 - 719162  # 719162: 0001..1970
+    days += _DAYS_BEFORE_MONTH[month - 1] + day - 1
+    if month > 2 and _is_leap(year):
+        days += 1
+    return days
 
 
 def get_timestamp_ms() -> int:
@@ -39,3 +69,77 @@ def format_timestamp_us(us: int) -> str:
     """Format microsecond timestamp as human-readable string."""
     seconds = us / 1_000_000
     return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
+def parse_delta_iso_us(timestamp: str) -> int:
+    """
+    Parse a Delta Exchange ISO 8601 UTC timestamp to microseconds.
+
+    The exchange's 'YYYY-MM-DDTHH:MM:SS[.ffffff]Z' layout is sliced directly;
+    other layouts fall back to ciso8601 if installed, else datetime.fromisoformat.
+
+    Raises:
+        ValueError: If the timestamp cannot be parsed
+    """
+    micros = _parse_fixed_iso_us(timestamp)
+    if micros is not None:
+        return micros
+
+    if CISO8601_AVAILABLE:
+        dt = ciso8601.parse_datetime(timestamp)
+    else:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    return int(dt.timestamp() * 1_000_000)
+
+
+def _parse_fixed_iso_us(timestamp: str) -> int | None:
+    """
+    Parse 'YYYY-MM-DDTHH:MM:SS[.f+]Z' to microseconds by slicing.
+
+    Returns None for anything that does not match the layout exactly or has
+    an out-of-range field, so the caller's fallback parser can reject it.
+    """
+    n = len(timestamp)
+    if not (
+        (n == 20 or (n > 21 and timestamp[19] == "."))
+        and timestamp[-1] == "Z"
+        and timestamp[4] == timestamp[7] == "-"
+        and timestamp[10] == "T"
+        and timestamp[13] == timestamp[16] == ":"
+    ):
+        return None
+
+    fraction = timestamp[20:-1]
+    digits = (
+        timestamp[0:4]
+        + timestamp[5:7]
+        + timestamp[8:10]
+        + timestamp[11:13]
+        + timestamp[14:16]
+        + timestamp[17:19]
+        + fraction
+    )
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+
+    year = int(timestamp[0:4])
+    month = int(timestamp[5:7])
+    day = int(timestamp[8:10])
+    hour = int(timestamp[11:13])
+    minute = int(timestamp[14:16])
+    second = int(timestamp[17:19])
+    if not (
+        year >= 1
+        and 1 <= month <= 12
+        and hour < 24
+        and minute < 60
+        and second < 60
+        and 1 <= day <= _DAYS_IN_MONTH[month - 1] + (month == 2 and _is_leap(year))
+    ):
+        return None
+
+    seconds = (
+        _days_since_epoch(year, month, day) * 86400 + hour * 3600 + minute * 60 + second
+    )
+    micros = int(fraction[:6].ljust(6, "0")) if fraction else 0
+    return seconds * 1_000_000 + micros
@@ -1,13 +1,19 @@
 """Unit tests for framework components."""
 
+import asyncio
+
 import pytest
 
 from deltatrader.client.rest import RestClient
 from deltatrader.client.websocket import WebSocketClient
+from deltatrader.models.order import Order
 from deltatrader.models.orderbook import OrderBook
 from deltatrader.models.product import Product
 from deltatrader.utils.config import Config
+from deltatrader.utils.event_loop import UVLOOP_AVAILABLE, configure_loop
 from deltatrader.utils.integer_conversion import IntegerConverter
+from deltatrader.utils.logger import LogRateLimiter
+from deltatrader.utils.timing import parse_delta_iso_us
 
 
 class TestRestClient:
@@ -153,6 +159,16 @@ class TestIntegerConversion:
 
         assert price_str == price_back
 
+    def test_integer_to_price_formatting(self, converter: IntegerConverter):
+        """Test that prices format as plain decimals with trailing zeros stripped."""
+        converter.set_scale("ETHUSD", 100)
+        assert converter.integer_to_price("ETHUSD", 123450) == "1234.5"
+        assert converter.integer_to_price("ETHUSD", 123400) == "1234"
+        assert converter.integer_to_price("ETHUSD", 5) == "0.05"
+        assert converter.integer_to_price("ETHUSD", 0) == "0"
+        # Unregistered symbols use 8 decimals, without exponent notation
+        assert converter.integer_to_price("UNKNOWN", 1) == "0.00000001"
+
     def test_size_conversion_integer(self, converter: IntegerConverter):
         """Test size conversion for integer input."""
         size = 10
@@ -172,6 +188,18 @@ class TestIntegerConversion:
         size_back = converter.integer_to_size(size_int)
         assert "10.5" in size_back
 
+    def test_integer_to_contract_count(self, converter: IntegerConverter):
+        """Test converting integer sizes to whole contract counts."""
+        assert converter.integer_to_contract_count(10) == 10
+        assert (
+            converter.integer_to_contract_count(converter.size_to_integer("25.0")) == 25
+        )
+        # Agrees with the previous int(float(integer_to_size(...))) round-trip
+        for size in (1, 999999, 150000000, 1234567890):
+            assert converter.integer_to_contract_count(size) == int(
+                float(converter.integer_to_size(size))
+            )
+
     def test_normalize_price(self, registered_converter: IntegerConverter):
         """Test price normalization to tick size."""
         # Get a price that's not aligned to tick
@@ -191,6 +219,26 @@ class TestIntegerConversion:
         assert converter.get_scale("TEST") == 1000
         assert converter._product_tick_sizes["TEST"] == 5
 
+    def test_price_cache_cleared_on_scale_change(self, converter: IntegerConverter):
+        """Test that cached price conversions follow scale changes."""
+        converter.set_scale("TEST", 100)
+        assert converter.price_to_integer("TEST", "1.25") == 125
+        assert converter.price_to_integer("TEST", "1.25") == 125
+        assert converter._price_cache.cache_info().hits == 1
+
+        converter.set_scale("TEST", 1000)
+        assert converter.price_to_integer("TEST", "1.25") == 1250
+
+    def test_price_encoder(self, converter: IntegerConverter):
+        """Test that a symbol-bound encoder matches price_to_integer."""
+        converter.set_scale("TEST", 100)
+        encode = converter.price_encoder("TEST")
+        assert encode("1.25") == converter.price_to_integer("TEST", "1.25")
+
+        # Bound encoders follow later scale changes
+        converter.set_scale("TEST", 1000)
+        assert encode("1.25") == 1250
+
 
 class TestOrderbookOperations:
     """Test suite for orderbook operations."""
@@ -300,6 +348,90 @@ class TestOrderbookOperations:
         assert len(orderbook.asks) < original_ask_count
 
 
+class TestTiming:
+    """Test timestamp helpers."""
+
+    def test_parse_delta_iso_us(self):
+        """Test parsing the exchange's ISO timestamps to microseconds."""
+        assert parse_delta_iso_us("2024-01-01T00:00:00Z") == 1704067200_000000
+        assert parse_delta_iso_us("2026-02-07T12:22:51.882176Z") == 1770466971_882176
+        assert parse_delta_iso_us("2026-02-07T12:22:51.88Z") == 1770466971_880000
+        assert parse_delta_iso_us("2024-02-29T23:59:59Z") == 1709251199_000000
+        assert parse_delta_iso_us("2100-03-01T00:00:00Z") == 4107542400_000000
+
+        with pytest.raises(ValueError):
+            parse_delta_iso_us("2024-13-01T00:00:00Z")
+
+    @pytest.mark.parametrize(
+        "timestamp",
+        [
+            "2024-02-30T10:30:45.123456Z",  # Day past the end of the month
+            "2023-02-29T10:30:45Z",  # Not a leap year
+            "2024-01-00T10:30:45Z",
+            "2024-01-15T25:30:45.123456Z",
+            "2024-01-15T10:60:45Z",
+            "2024-01-15T10:30:60Z",
+            "2024/01/15T10:30:45Z",  # Wrong date separators
+            "2024-01-15T10-30-45Z",  # Wrong time separators
+            "2024-01-15T10:30:45,123Z",  # Fraction without a dot
+            "2024-01-15T10:30:+5.123Z",  # Sign inside a field
+        ],
+    )
+    def test_parse_delta_iso_us_rejects_invalid(self, timestamp: str):
+        """Test that malformed or out-of-range timestamps raise ValueError."""
+        with pytest.raises(ValueError):
+            parse_delta_iso_us(timestamp)
+
+    def test_parse_delta_iso_us_fallback(self):
+        """Test that other ISO layouts go through the fallback parser."""
+        assert parse_delta_iso_us("2024-01-01T05:30:00+05:30") == 1704067200_000000
+
+        with pytest.raises(ValueError):
+            parse_delta_iso_us("not-a-timestampZ")
+
+    def test_order_from_api_timestamp(self, registered_converter: IntegerConverter):
+        """Test that Order.from_api parses created_at to exact microseconds."""
+        data = {
+            "id": 1,
+            "side": "buy",
+            "order_type": "limit_order",
+            "size": 10,
+            "unfilled_size": 10,
+            "limit_price": "50000.0",
+            "state": "open",
+            "created_at": "2026-02-07T12:22:51.882176Z",
+            "product": {"id": 84, "symbol": "BTCUSD"},
+        }
+
+        order = Order.from_api(data, registered_converter)
+        assert order.timestamp == 1770466971_882176
+        assert order.status == "open"
+
+
+class TestLogRateLimiter:
+    """Test the log rate limiter."""
+
+    def test_burst_then_suppress(self):
+        """Test that calls beyond the burst are suppressed and counted."""
+        limiter = LogRateLimiter(rate=0.001, burst=2)
+
+        assert limiter.try_acquire()
+        assert limiter.try_acquire()
+        assert not limiter.try_acquire()
+        assert limiter.suppressed == 1
+
+
+class TestEventLoop:
+    """Test event loop configuration."""
+
+    def test_configure_loop(self):
+        """Test that uvloop is installed only when available."""
+        try:
+            assert configure_loop() is UVLOOP_AVAILABLE
+        finally:
+            asyncio.set_event_loop_policy(None)
+
+
 class TestConfiguration:
     """Test suite for configuration."""
 
@@ -117,6 +117,20 @@ class TestL2UpdatesSubscription:
         assert "BTCUSD" not in market_data_manager._orderbooks
         assert "BTCUSD" not in market_data_manager._pending_snapshots
 
+    @pytest.mark.asyncio
+    async def test_unsubscribe_uses_subscribed_channel(
+        self, market_data_manager, ws_client
+    ):
+        """Test that the channel name is fixed when the symbol is subscribed."""
+        with patch.object(Config, "ORDERBOOK_CHANNEL", "l2_updates"):
+            await market_data_manager.subscribe_orderbook("BTCUSD")
+
+        with patch.object(Config, "ORDERBOOK_CHANNEL", "l2_orderbook"):
+            await market_data_manager.unsubscribe_orderbook("BTCUSD")
+
+        ws_client.unsubscribe.assert_called_once_with(["l2_updates.BTCUSD"])
+        assert "BTCUSD" not in market_data_manager._ob_channels
+
 
 class TestL2UpdatesMessageHandling:
     """Test message handling for l2_updates channel."""
@@ -269,6 +283,106 @@ class TestL2UpdatesMessageHandling:
         assert orderbook.sequence_no == 0
         assert len(orderbook.bids) == 0
 
+    @pytest.mark.asyncio
+    async def test_callbacks_coalesced_per_loop_pass(self, market_data_manager):
+        """Test that back-to-back updates fan out to callbacks once."""
+        received = []
+        market_data_manager.add_orderbook_callback(
+            lambda symbol, ob: received.append((symbol, ob.sequence_no))
+        )
+
+        await market_data_manager._handle_orderbook_message(
+            {
+                "action": "snapshot",
+                "symbol": "BTCUSD",
+                "sequence_no": 100,
+                "buy": [{"limit_price": "50000.0", "size": "1.5"}],
+                "sell": [{"limit_price": "50000.5", "size": "1.0"}],
+            }
+        )
+        for seq in (101, 102):
+            await market_data_manager._handle_orderbook_message(
+                {
+                    "action": "update",
+                    "symbol": "BTCUSD",
+                    "sequence_no": seq,
+                    "buy": [{"limit_price": "50000.0", "size": "2.0"}],
+                    "sell": [],
+                }
+            )
+
+        assert received == []
+        await asyncio.sleep(0)
+        assert received == [("BTCUSD", 102)]
+
+    @pytest.mark.asyncio
+    async def test_deep_level_update_skips_callbacks(self, market_data_manager):
+        """Test that updates below an opt-in notify depth do not fan out."""
+        received = []
+        market_data_manager.add_orderbook_callback(
+            lambda symbol, ob: received.append((symbol, ob.sequence_no))
+        )
+
+        await market_data_manager._handle_orderbook_message(
+            {
+                "action": "snapshot",
+                "symbol": "BTCUSD",
+                "sequence_no": 100,
+                "buy": [["50000.0", "1"], ["49999.5", "1"], ["49999.0", "1"]],
+                "sell": [["50000.5", "1"], ["50001.0", "1"], ["50001.5", "1"]],
+            }
+        )
+        await asyncio.sleep(0)
+        received.clear()
+
+        # Off by default: every update is validated and notified
+        with patch.object(market_data_manager, "_validate_checksum") as validate:
+            await market_data_manager._handle_orderbook_message(
+                {
+                    "action": "update",
+                    "symbol": "BTCUSD",
+                    "sequence_no": 101,
+                    "buy": [["49999.0", "4"]],
+                    "sell": [],
+                }
+            )
+            await asyncio.sleep(0)
+            assert received == [("BTCUSD", 101)]
+            validate.assert_called_once()
+        received.clear()
+
+        with (
+            patch.object(Config, "ORDERBOOK_NOTIFY_DEPTH", 2),
+            patch.object(market_data_manager, "_validate_checksum") as validate,
+        ):
+            # Third bid level only: below the notify depth
+            await market_data_manager._handle_orderbook_message(
+                {
+                    "action": "update",
+                    "symbol": "BTCUSD",
+                    "sequence_no": 102,
+                    "buy": [["49999.0", "5"]],
+                    "sell": [],
+                }
+            )
+            await asyncio.sleep(0)
+            assert received == []
+            validate.assert_not_called()
+
+            # Best ask changes: callbacks run again
+            await market_data_manager._handle_orderbook_message(
+                {
+                    "action": "update",
+                    "symbol": "BTCUSD",
+                    "sequence_no": 103,
+                    "buy": [],
+                    "sell": [["50000.5", "2"]],
+                }
+            )
+            await asyncio.sleep(0)
+            assert received == [("BTCUSD", 103)]
+            validate.assert_called_once()
+
 
 class TestSequenceHandling:
     """Test sequence number handling and recovery."""
@@ -310,6 +424,36 @@ class TestSequenceHandling:
             assert ws_client.subscribe.call_count >= 1
             assert market_data_manager._pending_snapshots["BTCUSD"] is True
 
+    @pytest.mark.asyncio
+    async def test_resubscribe_backs_off_until_snapshot(
+        self, market_data_manager, ws_client
+    ):
+        """Test that repeated resyncs back off and a snapshot resets them."""
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        with patch("deltatrader.core.market_data.asyncio.sleep", fake_sleep):
+            for _ in range(3):
+                await market_data_manager._resubscribe_orderbook("BTCUSD")
+
+            assert delays == [0.01, 0.02, 0.04]
+            assert ws_client.subscribe.call_count == 3
+
+            snapshot_msg = {
+                "action": "snapshot",
+                "symbol": "BTCUSD",
+                "timestamp": 1234567890,
+                "sequence_no": 100,
+                "buy": [{"limit_price": "50000.0", "size": "1.5"}],
+                "sell": [{"limit_price": "50000.5", "size": "1.0"}],
+            }
+            await market_data_manager._handle_orderbook_message(snapshot_msg)
+            await market_data_manager._resubscribe_orderbook("BTCUSD")
+
+        assert delays[-1] == 0.01
+
     @pytest.mark.asyncio
     async def test_sequence_continuity(self, market_data_manager):
         """Test that continuous sequence numbers are accepted."""
@@ -413,7 +557,12 @@ class TestChecksumValidation:
         }
 
         # Should not raise exception, just log warning
-        await market_data_manager._handle_orderbook_message(update_msg)
+        with patch("deltatrader.core.market_data.logger.warning") as mock_warning:
+            await market_data_manager._handle_orderbook_message(update_msg)
+
+        message = mock_warning.call_args.args[0]
+        assert message.startswith("Checksum validation failed for BTCUSD")
+        assert "Checksum string: 50000.5:1.0|50000.0:2.0" in message
 
         # Update still applied
         orderbook = market_data_manager._orderbooks["BTCUSD"]
@@ -578,3 +727,54 @@ class TestWebSocketMessageRouting:
 
         # Handler should be called
         assert handler_called
+
+    @pytest.mark.asyncio
+    async def test_add_and_remove_handler(self):
+        """Test that handlers are stored as tuples and removed cleanly."""
+        ws_client = WebSocketClient()
+
+        async def handler_a(data):
+            pass
+
+        async def handler_b(data):
+            pass
+
+        ws_client.add_handler("l2_updates.BTCUSD", handler_a)
+        ws_client.add_handler("l2_updates.BTCUSD", handler_b)
+        ws_client.add_handler("orders", handler_a)
+
+        assert ws_client._channel_handlers["l2_updates.BTCUSD"] == (
+            handler_a,
+            handler_b,
+        )
+        assert ws_client._message_handlers["orders"] == (handler_a,)
+
+        ws_client.remove_handler("l2_updates.BTCUSD", handler_a)
+        ws_client.remove_handler("orders", handler_a)
+
+        assert ws_client._channel_handlers["l2_updates.BTCUSD"] == (handler_b,)
+        assert ws_client._message_handlers["orders"] == ()
+
+    @pytest.mark.asyncio
+    async def test_resubscribe_payload_cached_until_subscriptions_change(self):
+        """Test that the resubscribe message is built once per subscription set."""
+        ws_client = WebSocketClient()
+        ws_client.ws = MagicMock()
+        ws_client.ws.closed = False
+        ws_client.ws.send_json = AsyncMock()
+        ws_client.ws.send_str = AsyncMock()
+
+        await ws_client.subscribe(["l2_updates.BTCUSD", "all_trades.BTCUSD"])
+        await ws_client._resubscribe_all()
+        cached = ws_client._cached_sub_payload
+        await ws_client._resubscribe_all()
+
+        assert cached is not None
+        assert ws_client._cached_sub_payload is cached
+        ws_client.ws.send_str.assert_called_with(cached[1])
+
+        await ws_client.unsubscribe(["all_trades.BTCUSD"])
+        await ws_client._resubscribe_all()
+        assert ws_client._cached_sub_payload is not cached
+        assert ws_client._cached_sub_payload[0] == {"l2_updates.BTCUSD"}
+        assert "all_trades" not in ws_client._cached_sub_payload[1]
@@ -1,13 +1,17 @@
 """Unit tests for LiveOrderManager."""
 
 import asyncio
+import os
+import threading
+import time
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
-from deltatrader.client.rest import RestClient
-from deltatrader.core.live_order_manager import LiveOrderManager
+from deltatrader.client.rest import RestApiError, RestClient
+from deltatrader.core.live_order_manager import LiveOrderManager, _bulk_parse
 from deltatrader.models.order import Order
+from deltatrader.utils.config import Config
 from deltatrader.utils.integer_conversion import IntegerConverter
 
 
@@ -90,6 +94,22 @@ class TestLiveOrderManager:
             assert result.client_order_id is not None
             assert len(result.client_order_id) == 32  # UUID hex
 
+    @pytest.mark.asyncio
+    async def test_client_order_id_pool(
+        self, testnet_rest_client: RestClient, registered_converter: IntegerConverter
+    ):
+        """Test that client order IDs come from a bulk-refilled pool."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+
+        with patch(
+            "deltatrader.core.live_order_manager.os.urandom", wraps=os.urandom
+        ) as mock_urandom:
+            ids = [manager._next_client_order_id() for _ in range(300)]
+
+        assert mock_urandom.call_count == 2
+        assert len(set(ids)) == 300
+        assert all(len(cid) == 32 for cid in ids)
+
     @pytest.mark.asyncio
     async def test_place_order_preserves_client_order_id(
         self,
@@ -294,6 +314,38 @@ class TestLiveOrderManager:
             assert success is True
             assert manager._orders["test_order"].status == "cancelled"
 
+    @pytest.mark.asyncio
+    async def test_cancel_order_skips_closed_order(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that cancelling an order already closed via WS skips REST."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        order = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=5000000,
+            client_order_id="filled_order",
+            product_id=84,
+            status="filled",
+        )
+        manager._orders["filled_order"] = order
+
+        with patch.object(
+            testnet_rest_client, "cancel_order", new_callable=AsyncMock
+        ) as mock_cancel:
+            success = await manager.cancel_order("filled_order")
+
+            assert success is True
+            mock_cancel.assert_not_called()
+            assert order.status == "filled"
+
     @pytest.mark.asyncio
     async def test_cancel_all_orders(
         self,
@@ -332,6 +384,186 @@ class TestLiveOrderManager:
                 if o.client_order_id.startswith("order_")
             )
 
+    @pytest.mark.asyncio
+    async def test_context_manager_manages_rest_session(
+        self, registered_converter: IntegerConverter
+    ):
+        """Test that the manager opens and closes the shared REST session."""
+        rest_client = RestClient()
+
+        async with LiveOrderManager(rest_client, registered_converter) as manager:
+            assert manager.rest_client.session is not None
+            assert not manager.rest_client.session.closed
+            assert manager.rest_client.session.connector.limit == Config.REST_POOL_SIZE
+
+        assert rest_client.session.closed
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_orders_skips_closed_orders(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that cancel_all_orders only visits open orders for the symbol."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        for client_order_id, symbol, status in [
+            ("open_btc", "BTCUSD", "open"),
+            ("filled_btc", "BTCUSD", "filled"),
+            ("open_eth", "ETHUSD", "pending"),
+        ]:
+            manager._orders[client_order_id] = Order(
+                symbol=symbol,
+                side="buy",
+                order_type="limit_order",
+                size=10,
+                price=5000000,
+                client_order_id=client_order_id,
+                status=status,
+            )
+
+        # Status changed outside _set_status is dropped from the index lazily
+        manager._orders["open_eth"].status = "rejected"
+        assert manager._orders.open_orders() == [manager._orders["open_btc"]]
+
+        # Re-opening through _set_status puts the order back in the index
+        manager._set_status(manager._orders["open_eth"], "open")
+        assert manager._orders.open_orders("ETHUSD") == [manager._orders["open_eth"]]
+
+        with patch.object(
+            testnet_rest_client, "cancel_all_orders", new_callable=AsyncMock
+        ):
+            count = await manager.cancel_all_orders("BTCUSD")
+
+        assert count == 1
+        assert manager._orders["open_btc"].status == "cancelled"
+        assert manager._orders["filled_btc"].status == "filled"
+        assert manager._orders["open_eth"].status == "open"
+        assert manager._orders.open_orders("BTCUSD") == []
+
+    @pytest.mark.asyncio
+    async def test_closed_orders_are_evicted_beyond_history_size(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+    ):
+        """Test that only the most recent closed orders are retained."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager._orders._max_closed = 2
+
+        for i in range(4):
+            manager._orders[f"hist_{i}"] = Order(
+                symbol="BTCUSD",
+                side="buy",
+                order_type="limit_order",
+                size=1,
+                price=5000000,
+                client_order_id=f"hist_{i}",
+                status="open",
+            )
+        for i in range(3):
+            manager._set_status(manager._orders[f"hist_{i}"], "cancelled")
+
+        # Oldest closed order evicted; open order is never evicted
+        assert "hist_0" not in manager._orders
+        assert manager.get_order("hist_1").status == "cancelled"
+        assert manager.get_order("hist_2").status == "cancelled"
+        assert manager._orders.open_orders() == [manager._orders["hist_3"]]
+
+    @pytest.mark.asyncio
+    async def test_place_orders_batches_by_product(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that place_orders sends one batch request and maps responses."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        orders = [
+            Order(
+                symbol="BTCUSD",
+                side="buy",
+                order_type="limit_order",
+                size=10,
+                price=5000000 + i * 100,
+                client_order_id=f"batch_{i}",
+            )
+            for i in range(2)
+        ]
+        unknown = Order(
+            symbol="UNKNOWN", side="buy", order_type="limit_order", size=1, price=1
+        )
+
+        with patch.object(
+            testnet_rest_client, "place_batch_orders", new_callable=AsyncMock
+        ) as mock_batch:
+            # Exchange only acknowledges the first order
+            mock_batch.return_value = [
+                {"id": 501, "state": "open", "client_order_id": "batch_0"}
+            ]
+
+            await manager.place_orders(orders + [unknown])
+
+            mock_batch.assert_called_once()
+            product_id, payloads = mock_batch.call_args.args
+            assert product_id == 84
+            assert [p["client_order_id"] for p in payloads] == ["batch_0", "batch_1"]
+
+        assert orders[0].status == "open"
+        assert orders[0].exchange_order_id == 501
+        assert manager._orders["batch_0"] is orders[0]
+        assert orders[1].status == "rejected"
+        assert unknown.status == "rejected"
+
+    @pytest.mark.asyncio
+    async def test_submit_order_coalesces_concurrent_orders(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that concurrently submitted orders share one batch request."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        orders = [
+            Order(
+                symbol="BTCUSD",
+                side="sell",
+                order_type="limit_order",
+                size=5,
+                price=5000000,
+                client_order_id=f"coalesced_{i}",
+            )
+            for i in range(3)
+        ]
+
+        with (
+            patch.object(
+                testnet_rest_client, "place_batch_orders", new_callable=AsyncMock
+            ) as mock_batch,
+            patch.object(
+                testnet_rest_client, "place_order", new_callable=AsyncMock
+            ) as mock_place,
+        ):
+            mock_batch.return_value = [
+                {"id": i, "state": "open", "client_order_id": o.client_order_id}
+                for i, o in enumerate(orders)
+            ]
+
+            results = await asyncio.gather(*(manager.submit_order(o) for o in orders))
+            await manager.stop_batching()
+
+            assert mock_batch.call_count == 1
+            mock_place.assert_not_called()
+
+        assert results == orders
+        assert all(o.status == "open" for o in orders)
+
     @pytest.mark.asyncio
     async def test_get_open_orders(
         self,
@@ -381,6 +613,243 @@ class TestLiveOrderManager:
             assert orders[0].client_order_id == "order_1"
             assert orders[1].client_order_id == "order_2"
 
+    @pytest.mark.asyncio
+    async def test_get_open_orders_large_response_parsed_in_pool(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that large open-order responses are parsed off the event loop."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        mock_orders = [
+            {
+                "id": str(1000 + i),
+                "state": "open",
+                "created_at": "2024-01-01T00:00:00Z",
+                "product": {"symbol": "BTCUSD", "id": 84},
+                "side": "buy",
+                "order_type": "limit_order",
+                "size": 10,
+                "unfilled_size": 10,
+                "limit_price": "50000.0",
+                "client_order_id": f"bulk_{i}",
+            }
+            for i in range(60)
+        ]
+
+        parse_threads = []
+
+        def recording_parse(response, converter):
+            parse_threads.append(threading.current_thread().name)
+            return _bulk_parse(response, converter)
+
+        # The pool is only created once a response needs it
+        assert manager._parse_pool is None
+
+        with (
+            patch.object(
+                testnet_rest_client, "get_open_orders", new_callable=AsyncMock
+            ) as mock_get,
+            patch(
+                "deltatrader.core.live_order_manager._bulk_parse",
+                side_effect=recording_parse,
+            ),
+        ):
+            mock_get.return_value = mock_orders
+
+            orders = await manager.get_open_orders()
+
+        assert len(parse_threads) == 1
+        assert parse_threads[0].startswith("order-parse")
+        assert [o.client_order_id for o in orders] == [f"bulk_{i}" for i in range(60)]
+        assert all(manager._orders[o.client_order_id] is o for o in orders)
+
+        # close() releases the worker threads
+        await manager.close()
+        assert manager._parse_pool is None
+
+    @pytest.mark.asyncio
+    async def test_order_update_reuses_unchanged_conversions(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that repeated raw WS fields are not converted again."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+        manager._orders["ws_order"] = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=100000,
+            client_order_id="ws_order",
+            status="open",
+        )
+
+        message = {
+            "type": "order_open",
+            "client_order_id": "ws_order",
+            "unfilled_size": 6,
+            "average_fill_price": "50000.5",
+        }
+
+        with patch.object(
+            registered_converter,
+            "price_to_integer",
+            wraps=registered_converter.price_to_integer,
+        ) as mock_price:
+            await manager._handle_order_update(message)
+            await manager._handle_order_update(dict(message))
+            assert mock_price.call_count == 1
+
+            await manager._handle_order_update(
+                {**message, "average_fill_price": "50001.0"}
+            )
+            assert mock_price.call_count == 2
+
+        order = manager._orders["ws_order"]
+        assert order.filled_size == 4
+        assert order.average_fill_price == 500010
+
+    @pytest.mark.asyncio
+    async def test_order_update_resolves_symbol_from_product_id(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that WS orders carrying only product_id get their symbol."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        assert manager.get_symbol(84) == "BTCUSD"
+
+        await manager._handle_order_update(
+            {
+                "type": "order_open",
+                "client_order_id": "external_order",
+                "product_id": 84,
+                "side": "sell",
+                "size": 3,
+                "unfilled_size": 3,
+                "limit_price": "50000.0",
+                "state": "open",
+            }
+        )
+
+        order = manager._orders["external_order"]
+        assert order.symbol == "BTCUSD"
+        assert order.product_id == 84
+        assert order.status == "open"
+
+    @pytest.mark.asyncio
+    async def test_order_update_status_transitions(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test status transitions for each WS order message type."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+
+        cases = [
+            ("order_closed", {"size": 10, "average_fill_price": "50000.0"}, "filled"),
+            ("order_closed", {"size": 0}, "cancelled"),
+            ("order_cancelled", {}, "cancelled"),
+            ("order_rejected", {}, "rejected"),
+            ("order_created", {}, "open"),
+        ]
+        for i, (msg_type, fields, expected) in enumerate(cases):
+            client_order_id = f"transition_{i}"
+            manager._orders[client_order_id] = Order(
+                symbol="BTCUSD",
+                side="buy",
+                order_type="limit_order",
+                size=10,
+                price=500000,
+                client_order_id=client_order_id,
+                status="pending",
+            )
+            await manager._handle_order_update(
+                {"type": msg_type, "client_order_id": client_order_id, **fields}
+            )
+            assert manager._orders[client_order_id].status == expected, msg_type
+
+        assert manager._orders["transition_0"].average_fill_price == 500000
+
+    @pytest.mark.asyncio
+    async def test_fill_updates_accumulate_average_price(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that fills update the volume-weighted average fill price."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+        manager._orders["fill_order"] = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=500000,
+            client_order_id="fill_order",
+            status="open",
+        )
+
+        await manager._handle_fill_update(
+            {"client_order_id": "fill_order", "size": 4, "price": "50000.0"}
+        )
+        await manager._handle_fill_update(
+            {"client_order_id": "fill_order", "size": 6, "price": "50010.0"}
+        )
+
+        order = manager._orders["fill_order"]
+        assert order.filled_size == 10
+        # (500000 * 4 + 500100 * 6) // 10
+        assert order.average_fill_price == 500060
+        assert order.status == "filled"
+
+    @pytest.mark.asyncio
+    async def test_duplicate_fill_is_ignored(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+        test_product,
+    ):
+        """Test that a fill replayed with the same ID is applied once."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.register_product(test_product)
+        manager._orders["dup_order"] = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=500000,
+            client_order_id="dup_order",
+            status="open",
+        )
+
+        fill = {
+            "id": 9001,
+            "client_order_id": "dup_order",
+            "size": 4,
+            "price": "50000.0",
+        }
+        await manager._handle_fill_update(fill)
+        await manager._handle_fill_update(dict(fill))
+
+        order = manager._orders["dup_order"]
+        assert order.filled_size == 4
+        assert order.status == "partially_filled"
+        assert manager._ws_fill_updates == 1
+
     @pytest.mark.asyncio
     async def test_edit_order(
         self,
@@ -507,6 +976,10 @@ class TestLiveOrderManager:
         await manager.stop_reconciliation()
         assert manager._running is False
 
+        # The loop exits on the stop event rather than being cancelled
+        assert manager._reconciliation_task.done()
+        assert not manager._reconciliation_task.cancelled()
+
     @pytest.mark.asyncio
     async def test_set_reconciliation_interval(
         self,
@@ -524,12 +997,139 @@ class TestLiveOrderManager:
         manager.set_reconciliation_interval(2)
         assert manager._reconciliation_interval == 5
 
+    @pytest.mark.asyncio
+    async def test_reconciliation_backs_off_when_throttled(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+    ):
+        """Test that a 429 keeps local orders and stretches the interval."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager.set_reconciliation_interval(10)
+        manager._orders["live_order"] = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=5000000,
+            client_order_id="live_order",
+            status="open",
+        )
+
+        with patch.object(
+            testnet_rest_client, "get_open_orders", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.side_effect = RestApiError(429, "Too many requests", 120.0)
+            stats = await manager.reconcile_orders()
+
+        assert stats["errors"] == 1
+        assert manager._orders["live_order"].status == "open"
+
+        # Throttled pass: doubled interval, but not sooner than Retry-After
+        manager._update_backoff()
+        assert manager._backoff_factor == 2
+        assert manager._current_interval == 120.0
+
+        # Clean pass decays back to the configured interval
+        manager._throttle_error = None
+        manager._update_backoff()
+        assert manager._backoff_factor == 1
+        assert manager._current_interval == 10
+
+    @pytest.mark.asyncio
+    async def test_reconciliation_skipped_while_ws_healthy(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+    ):
+        """Test that passes are skipped on fresh WS updates, with periodic checks."""
+        manager = LiveOrderManager(
+            testnet_rest_client, registered_converter, MagicMock()
+        )
+        manager._ws_subscribed = True
+
+        # No WebSocket update seen yet
+        assert manager._should_skip_reconciliation() is False
+
+        manager._last_ws_update = time.monotonic()
+        assert [manager._should_skip_reconciliation() for _ in range(4)] == [
+            True,
+            True,
+            True,
+            False,
+        ]
+        assert manager.get_statistics()["reconciliations_skipped"] == 3
+
+        # Stale updates always reconcile
+        manager._last_ws_update -= 60
+        assert manager._should_skip_reconciliation() is False
+
+    @pytest.mark.asyncio
+    async def test_ws_reconnect_requests_reconciliation(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+    ):
+        """Test that a WebSocket reconnect runs a pass even while WS is healthy."""
+        ws_client = MagicMock()
+        manager = LiveOrderManager(testnet_rest_client, registered_converter, ws_client)
+        ws_client.add_handler.assert_any_call("reconnect", manager._handle_ws_reconnect)
+        manager._ws_subscribed = True
+        manager._last_ws_update = time.monotonic()
+        manager.reconcile_orders = AsyncMock(
+            return_value={"synced": 0, "filled": 0, "cancelled": 0, "errors": 0}
+        )
+
+        await manager.start_reconciliation()
+        await manager._handle_ws_reconnect({"type": "reconnect"})
+        await asyncio.sleep(0.01)
+        assert manager.reconcile_orders.await_count == 1
+
+        await asyncio.wait_for(manager.stop_reconciliation(), 1.0)
+        assert manager.reconcile_orders.await_count == 1
+
     @pytest.mark.asyncio
     async def test_map_api_status(self):
         """Test status mapping from API to internal format."""
         assert LiveOrderManager._map_api_status("open") == "open"
         assert LiveOrderManager._map_api_status("pending") == "pending"
+        assert (
+            LiveOrderManager._map_api_status("partially_filled") == "partially_filled"
+        )
         assert LiveOrderManager._map_api_status("closed") == "filled"
         assert LiveOrderManager._map_api_status("cancelled") == "cancelled"
         assert LiveOrderManager._map_api_status("rejected") == "rejected"
         assert LiveOrderManager._map_api_status("unknown") == "pending"
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_orders_cancels_partially_filled(
+        self,
+        testnet_rest_client: RestClient,
+        registered_converter: IntegerConverter,
+    ):
+        """Test that partially filled orders stay open and are cancelled."""
+        manager = LiveOrderManager(testnet_rest_client, registered_converter)
+        manager._orders["partial"] = Order(
+            symbol="BTCUSD",
+            side="buy",
+            order_type="limit_order",
+            size=10,
+            price=5000000,
+            client_order_id="partial",
+            status="open",
+        )
+        manager._set_status(
+            manager._orders["partial"],
+            LiveOrderManager._map_api_status("partially_filled"),
+        )
+        assert manager._orders.open_count() == 1
+
+        with patch.object(
+            testnet_rest_client, "cancel_all_orders", new_callable=AsyncMock
+        ) as mock_cancel_all:
+            mock_cancel_all.return_value = {}
+            count = await manager.cancel_all_orders()
+
+        assert count == 1
+        assert manager._orders["partial"].status == "cancelled"
+        assert manager._orders.open_count() == 0
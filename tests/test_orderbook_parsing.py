@@ -188,6 +188,69 @@ class TestOrderbookParsing:
         for i in range(len(orderbook.asks) - 1):
             assert orderbook.asks[i][0] <= orderbook.asks[i + 1][0]
 
+    def test_unsorted_snapshot_keeps_raw_levels_aligned(self, btc_converter):
+        """Test that raw levels are sorted in step with integer levels."""
+        orderbook = OrderBook(symbol="BTCUSD")
+
+        data = {
+            "type": "l2_updates",
+            "symbol": "BTCUSD",
+            "sequence_no": 1,
+            "bids": [["49999.5", "3"], ["50000.0", "1"], ["49999.0", "2"]],
+            "asks": [["50101.0", "6"], ["50100.0", "4"], ["50100.5", "5"]],
+        }
+        orderbook.update_from_snapshot(data, btc_converter)
+
+        assert orderbook._raw_bids == [
+            ("50000.0", "1"),
+            ("49999.5", "3"),
+            ("49999.0", "2"),
+        ]
+        assert orderbook._raw_asks == [
+            ("50100.0", "4"),
+            ("50100.5", "5"),
+            ("50101.0", "6"),
+        ]
+        assert [size for _, size in orderbook.bids] == [1, 3, 2]
+        assert [size for _, size in orderbook.asks] == [4, 5, 6]
+
+    def test_apply_update_inserts_in_sorted_position(self, btc_converter):
+        """Test that updates insert, modify and remove levels in place."""
+        orderbook = OrderBook(symbol="BTCUSD")
+        orderbook.update_from_snapshot(
+            {
+                "symbol": "BTCUSD",
+                "sequence_no": 1,
+                "bids": [["50000.0", "1"], ["49999.0", "2"]],
+                "asks": [["50100.0", "4"], ["50101.0", "6"]],
+            },
+            btc_converter,
+        )
+
+        assert orderbook.apply_update(
+            {
+                "symbol": "BTCUSD",
+                "sequence_no": 2,
+                "bids": [["49999.5", "3"], ["50000.0", "0"], ["49998.0", "7"]],
+                "asks": [["50100.5", "5"], ["50101.0", "8"], ["50099.5", "9"]],
+            },
+            btc_converter,
+        )
+
+        assert orderbook._raw_bids == [
+            ("49999.5", "3"),
+            ("49999.0", "2"),
+            ("49998.0", "7"),
+        ]
+        assert orderbook._raw_asks == [
+            ("50099.5", "9"),
+            ("50100.0", "4"),
+            ("50100.5", "5"),
+            ("50101.0", "8"),
+        ]
+        assert [size for _, size in orderbook.bids] == [3, 2, 7]
+        assert [size for _, size in orderbook.asks] == [9, 4, 5, 8]
+
     def test_empty_orderbook(self, btc_converter):
         """Test handling of empty orderbook."""
         orderbook = OrderBook(symbol="BTCUSD")
@@ -20,9 +20,12 @@ class TestPaperOrderManager:
 
         assert manager.converter == converter
         assert manager._order_counter == 0
-        assert manager._simulated_latency == 0.05
+        assert manager._simulated_latency == 0.0
         assert len(manager._orders) == 0
 
+        manager = PaperOrderManager(converter, simulated_latency=0.05)
+        assert manager._simulated_latency == 0.05
+
     @pytest.mark.asyncio
     async def test_place_limit_order(
         self, paper_order_manager: PaperOrderManager, test_product
@@ -46,6 +49,7 @@ class TestPaperOrderManager:
         assert result.exchange_order_id is not None
         assert result.client_order_id is not None
         assert result.timestamp > 0
+        assert not hasattr(result, "__dict__")
 
         # Verify order is stored
         assert result.client_order_id in paper_order_manager._orders
@@ -72,6 +76,7 @@ class TestPaperOrderManager:
         # Market orders should be accepted
         assert result.status == "open"
         assert result.client_order_id is not None
+        assert len(paper_order_manager._pending_fills) == 1
 
         # Wait for simulated fill
         await asyncio.sleep(0.2)
@@ -80,6 +85,40 @@ class TestPaperOrderManager:
         stored_order = paper_order_manager.get_order(result.client_order_id)
         assert stored_order.status == "filled"
         assert stored_order.filled_size == stored_order.size
+        assert not paper_order_manager._pending_fills
+        assert paper_order_manager._fill_timer is None
+
+    @pytest.mark.asyncio
+    async def test_market_order_fills_share_one_timer(
+        self, paper_order_manager: PaperOrderManager, test_product
+    ):
+        """Test that queued fills are drained by a single timer in due order."""
+        paper_order_manager.register_product(test_product)
+
+        orders = []
+        for i in range(3):
+            order = Order(
+                symbol="BTCUSD",
+                side="buy",
+                order_type="market_order",
+                size=i + 1,
+                product_id=84,
+            )
+            orders.append(await paper_order_manager.place_order(order))
+        timer = paper_order_manager._fill_timer
+
+        # An earlier fill re-arms the timer for itself
+        early = orders[2]
+        paper_order_manager._schedule_fill(early, delay=0.01)
+        assert paper_order_manager._fill_timer is not timer
+        await asyncio.sleep(0.05)
+        assert early.status == "filled"
+        assert orders[0].status == "open"
+
+        await asyncio.sleep(0.1)
+        assert all(o.status == "filled" for o in orders)
+        assert not paper_order_manager._pending_fills
+        assert paper_order_manager._fill_timer is None
 
     @pytest.mark.asyncio
     async def test_place_multiple_orders(
@@ -108,6 +147,9 @@ class TestPaperOrderManager:
         # Verify all have unique IDs
         order_ids = [o.client_order_id for o in orders]
         assert len(set(order_ids)) == 5
+        prefix = paper_order_manager._id_prefix
+        assert order_ids[0] == f"{prefix}{1:024x}"
+        assert all(len(order_id) == 32 for order_id in order_ids)
 
     @pytest.mark.asyncio
     async def test_cancel_order(
@@ -281,6 +323,41 @@ class TestPaperOrderManager:
         assert len(open_orders) == 3
         assert all(o.status in ["open", "pending"] for o in open_orders)
 
+    @pytest.mark.asyncio
+    async def test_open_index_tracks_transitions(
+        self, paper_order_manager: PaperOrderManager, test_product
+    ):
+        """Test that cancels and fills drop orders from the open index."""
+        paper_order_manager.register_product(test_product)
+
+        orders = []
+        for i in range(3):
+            order = Order(
+                symbol="BTCUSD",
+                side="buy",
+                order_type="limit_order",
+                size=i + 1,
+                price=50000 + (i * 100),
+                product_id=84,
+            )
+            orders.append(await paper_order_manager.place_order(order))
+
+        assert paper_order_manager._orders.open_count() == 3
+
+        await paper_order_manager.cancel_order(orders[0].client_order_id)
+        paper_order_manager.simulate_fill(orders[1].client_order_id)
+
+        # Closed orders leave the index eagerly, not on the next query
+        assert paper_order_manager._orders.open_count() == 1
+        open_orders = await paper_order_manager.get_open_orders("BTCUSD")
+        assert open_orders == [orders[2]]
+
+        # Statuses the store does not know as closed keep the order open
+        orders[2].status = "untriggered"
+        paper_order_manager._orders.reindex(orders[2].client_order_id, orders[2])
+        assert paper_order_manager._orders.open_count() == 1
+        assert await paper_order_manager.get_open_orders("BTCUSD") == [orders[2]]
+
     @pytest.mark.asyncio
     async def test_get_open_orders_by_symbol(
         self, paper_order_manager: PaperOrderManager, test_product
@@ -505,6 +582,30 @@ class TestPaperOrderManager:
         await paper_order_manager.stop_reconciliation()
         assert paper_order_manager._running is False
 
+    @pytest.mark.asyncio
+    async def test_request_reconciliation_wakes_loop(
+        self, paper_order_manager: PaperOrderManager
+    ):
+        """Test that a requested pass runs before the interval elapses."""
+        passes = 0
+
+        async def fake_reconcile():
+            nonlocal passes
+            passes += 1
+            return {"synced": 0, "filled": 0, "cancelled": 0, "errors": 0}
+
+        paper_order_manager.reconcile_orders = fake_reconcile
+        await paper_order_manager.start_reconciliation()
+
+        paper_order_manager.request_reconciliation()
+        await asyncio.sleep(0.01)
+        assert passes == 1
+
+        # Stopping wakes the loop without running another pass
+        await asyncio.wait_for(paper_order_manager.stop_reconciliation(), 1.0)
+        assert passes == 1
+        assert paper_order_manager._reconciliation_task.done()
+
     @pytest.mark.asyncio
     async def test_set_reconciliation_interval(
         self, paper_order_manager: PaperOrderManager
@@ -524,6 +625,7 @@ class TestPaperOrderManager:
     ):
         """Test that simulated latency is applied."""
         paper_order_manager.register_product(test_product)
+        paper_order_manager.set_simulated_latency(0.05)
 
         order = Order(
             symbol="BTCUSD",
@@ -544,6 +646,10 @@ class TestPaperOrderManager:
         # Should take at least the simulated latency
         assert elapsed >= paper_order_manager._simulated_latency
 
+        # Negative values are clamped to zero
+        paper_order_manager.set_simulated_latency(-1)
+        assert paper_order_manager._simulated_latency == 0.0
+
     @pytest.mark.asyncio
     async def test_get_all_orders(
         self, paper_order_manager: PaperOrderManager, test_product
@@ -1,7 +1,8 @@
 """Tests for trade message handling."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -191,6 +192,133 @@ class TestTradeMessageHandling:
         assert len(received_trades) == 1
         assert received_trades[0].symbol == "XRPUSD"
 
+    @pytest.mark.asyncio
+    async def test_async_callback_error_logged(self, market_data_manager):
+        """Test that exceptions from async callbacks are logged, not lost."""
+
+        async def failing_callback(symbol: str, trades: list):
+            raise RuntimeError("boom")
+
+        market_data_manager.add_trade_callback(failing_callback)
+
+        with patch("deltatrader.core.market_data.logger.error") as mock_error:
+            await market_data_manager._handle_trade_message(
+                {
+                    "buyer_role": "taker",
+                    "price": "1.4399",
+                    "size": 2,
+                    "symbol": "XRPUSD",
+                    "timestamp": 1770576897065389,
+                    "type": "all_trades",
+                }
+            )
+            await asyncio.sleep(0.01)
+
+        mock_error.assert_called_once()
+        assert "boom" in mock_error.call_args.args[0]
+        assert not market_data_manager._callback_tasks
+
+    @pytest.mark.asyncio
+    async def test_sync_trade_callback_called_inline(self, market_data_manager):
+        """Test that plain-function callbacks run without scheduling a task."""
+        received = []
+        market_data_manager.add_trade_callback(
+            lambda symbol, trades: received.append((symbol, len(trades)))
+        )
+
+        await market_data_manager._handle_trade_message(
+            {
+                "buyer_role": "taker",
+                "price": "1.4399",
+                "size": 2,
+                "symbol": "XRPUSD",
+                "timestamp": 1770576897065389,
+                "type": "all_trades",
+            }
+        )
+
+        # No sleep needed: the callback already ran
+        assert received == [("XRPUSD", 1)]
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="eager tasks need 3.12+")
+    async def test_async_callback_without_await_runs_eagerly(self, market_data_manager):
+        """Test that async callbacks that never suspend finish inline."""
+        received = []
+
+        async def on_trade_update(symbol: str, trades: list):
+            received.append((symbol, len(trades)))
+
+        market_data_manager.add_trade_callback(on_trade_update)
+
+        await market_data_manager._handle_trade_message(
+            {
+                "buyer_role": "taker",
+                "price": "1.4399",
+                "size": 2,
+                "symbol": "XRPUSD",
+                "timestamp": 1770576897065389,
+                "type": "all_trades",
+            }
+        )
+
+        assert received == [("XRPUSD", 1)]
+        assert not market_data_manager._callback_tasks
+
+    @pytest.mark.asyncio
+    async def test_tick_callback_batches_book_and_trades(self, market_data_manager):
+        """Test that one loop pass of book and trade messages yields one tick."""
+        ticks = []
+        market_data_manager.add_tick_callback(ticks.append)
+
+        await market_data_manager._handle_orderbook_message(
+            {
+                "type": "l2_orderbook",
+                "symbol": "XRPUSD",
+                "timestamp": 1770576897065389,
+                "last_sequence_no": 1,
+                "buy": [{"limit_price": "1.4398", "size": 10}],
+                "sell": [{"limit_price": "1.4400", "size": 10}],
+            }
+        )
+        for i in range(2):
+            await market_data_manager._handle_trade_message(
+                {
+                    "buyer_role": "taker",
+                    "price": "1.4399",
+                    "size": i + 1,
+                    "symbol": "XRPUSD",
+                    "timestamp": 1770576897065389 + i,
+                    "type": "all_trades",
+                }
+            )
+
+        assert ticks == []
+        await asyncio.sleep(0)
+
+        assert len(ticks) == 1
+        tick = ticks[0]
+        assert tick.symbol == "XRPUSD"
+        assert tick.orderbook is market_data_manager.get_orderbook("XRPUSD")
+        assert [trade.size for trade in tick.trades] == [1, 2]
+
+        # A trade-only pass carries no orderbook
+        await market_data_manager._handle_trade_message(
+            {
+                "buyer_role": "maker",
+                "price": "1.4399",
+                "size": 3,
+                "symbol": "XRPUSD",
+                "timestamp": 1770576897065391,
+                "type": "all_trades",
+            }
+        )
+        await asyncio.sleep(0)
+
+        assert len(ticks) == 2
+        assert ticks[1].orderbook is None
+        assert [trade.size for trade in ticks[1].trades] == [3]
+
     @pytest.mark.asyncio
     async def test_trades_max_limit(self, market_data_manager):
         """Test that trades list is limited to max size."""
@@ -291,6 +419,32 @@ class TestTradeMessageHandling:
         empty_trades = market_data_manager.get_trades("BTCUSD")
         assert len(empty_trades) == 0
 
+    @pytest.mark.asyncio
+    async def test_get_trades_limit(self, market_data_manager):
+        """Test that get_trades returns the most recent trades as a list."""
+        for i in range(4):
+            await market_data_manager._handle_trade_message(
+                {
+                    "buyer_role": "taker",
+                    "price": "1.4399",
+                    "size": 1,
+                    "symbol": "XRPUSD",
+                    "timestamp": 1770576897065389 + i,
+                    "type": "all_trades",
+                }
+            )
+
+        recent = market_data_manager.get_trades("XRPUSD", limit=2)
+        assert isinstance(recent, list)
+        assert [t.timestamp for t in recent] == [
+            1770576897065391,
+            1770576897065392,
+        ]
+
+        latest = market_data_manager.latest_trade("XRPUSD")
+        assert latest is recent[-1]
+        assert market_data_manager.latest_trade("BTCUSD") is None
+
     @pytest.mark.asyncio
     async def test_trade_with_string_size(self, market_data_manager):
         """Test handling trade with size as string."""
@@ -356,3 +510,27 @@ class TestTradeMessageHandling:
         assert len(btc_trades) == 1
         assert xrp_trades[0].symbol == "XRPUSD"
         assert btc_trades[0].symbol == "BTCUSD"
+
+    def test_from_api_many_matches_from_api(self, converter):
+        """Test the batch constructor against from_api, skipping bad entries."""
+        trades_data = [
+            {"id": 1, "buyer_role": "taker", "price": "1.4399", "size": 2},
+            {"id": 2, "buyer_role": "maker", "price": "1.4400", "size": 3},
+            {"id": 3, "buyer_role": "taker", "size": 1},  # Missing price
+        ]
+
+        trades = Trade.from_api_many("XRPUSD", trades_data, converter)
+
+        assert trades == [
+            Trade.from_api("XRPUSD", data, converter) for data in trades_data[:2]
+        ]
+        assert not hasattr(trades[0], "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_get_subscribed_symbols_order(self, market_data_manager):
+        """Test that subscribed symbols are deduplicated in subscription order."""
+        await market_data_manager.subscribe_orderbook("XRPUSD")
+        await market_data_manager.subscribe_trades("BTCUSD")
+        await market_data_manager.subscribe_trades("XRPUSD")
+
+        assert market_data_manager.get_subscribed_symbols() == ["XRPUSD", "BTCUSD"]